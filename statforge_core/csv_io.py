@@ -24,4 +24,4 @@ def import_rows_from_csv(path: str | Path) -> list[dict[str, str]]:
     in_path = Path(path)
     with in_path.open("r", newline="", encoding="utf-8") as f:
         reader = csv.DictReader(f)
-        return [dict(row) for row in reader]
+        return list(reader)
@@ -35,15 +35,7 @@ def compute_catching_metrics(totals: dict[str, float]) -> dict[str, float]:
 
 
 def per_game_ops(row: dict[str, float]) -> float:
-    stats = {
-        "ab": row.get("ab", 0),
-        "h": row.get("h", 0),
-        "doubles": row.get("doubles", 0),
-        "triples": row.get("triples", 0),
-        "hr": row.get("hr", 0),
-        "bb": row.get("bb", 0),
-    }
-    return compute_hitting_metrics(stats)["OPS"]
+    return compute_hitting_metrics(row)["OPS"]
 
 
 def per_game_so_rate(row: dict[str, float]) -> float:
@@ -83,21 +75,17 @@ def compute_last5_trend(
     if len(game_rows) < 10:
         return "—"
 
-    last5 = [extractor(r) for r in game_rows[:5]]
-    prev5 = [extractor(r) for r in game_rows[5:10]]
-    last5_avg = average(last5)
-    prev5_avg = average(prev5)
+    last5_avg = sum(map(extractor, game_rows[:5])) / 5
+    prev5_avg = sum(map(extractor, game_rows[5:10])) / 5
     return trend_arrow(last5_avg, prev5_avg, inverse_better=inverse_better)
 
 
+_WINDOW_TRENDS = ("DOWN", "FLAT", "UP")
+
+
 def compare_window_to_season(window_value: float | None, season_value: float | None) -> dict[str, float | str]:
     if window_value is None or season_value is None:
         return {"delta": 0.0, "trend": "FLAT"}
     delta = window_value - season_value
-    if abs(delta) < 0.005:
-        trend = "FLAT"
-    elif delta > 0:
-        trend = "UP"
-    else:
-        trend = "DOWN"
+    trend = _WINDOW_TRENDS[1 if abs(delta) < 0.005 else 2 * int(delta > 0)]
     return {"delta": delta, "trend": trend}
@@ -46,6 +46,11 @@ INT_FIELDS = {
 }
 FLOAT_FIELDS = {"innings_caught", "avg", "obp", "slg", "ops", "transfer_time", "pop_time"}
 
+_TOKEN_SPLIT_RE = re.compile(r"[|,;]+")
+_MULTI_PAIR_RE = re.compile(r"(?i)\b([A-Za-z0-9_%\-]+)\s*[:=]\s*([0-9.]+%?)")
+_KEY_VALUE_RE = re.compile(r"(?i)^\s*([A-Za-z0-9_%\-\s]+)\s*[:=]\s*([0-9.]+%?)\s*$")
+_KEY_SPACE_VALUE_RE = re.compile(r"(?i)^\s*([A-Za-z0-9_%\-\s]+)\s+([0-9.]+%?)\s*$")
+
 
 def _to_number(raw: str) -> float | int | None:
     token = raw.strip().rstrip("%")
@@ -75,10 +80,10 @@ def parse_season_summary(text: str) -> dict[str, Any]:
 
     lines = [ln.strip() for ln in text.splitlines() if ln.strip()]
     for line in lines:
-        tokens = [t.strip() for t in re.split(r"[|,;]+", line) if t.strip()]
+        tokens = [t.strip() for t in _TOKEN_SPLIT_RE.split(line) if t.strip()]
         line_parsed = False
         for token in tokens:
-            multi_pairs = re.findall(r"(?i)\b([A-Za-z0-9_%\-]+)\s*[:=]\s*([0-9.]+%?)", token)
+            multi_pairs = _MULTI_PAIR_RE.findall(token)
             if len(multi_pairs) >= 2:
                 for raw_key, raw_val in multi_pairs:
                     norm_key = _normalize_key(raw_key)
@@ -94,9 +99,9 @@ def parse_season_summary(text: str) -> dict[str, Any]:
                     line_parsed = True
                 continue
 
-            m = re.match(r"(?i)^\s*([A-Za-z0-9_%\-\s]+)\s*[:=]\s*([0-9.]+%?)\s*$", token)
+            m = _KEY_VALUE_RE.match(token)
             if not m:
-                m = re.match(r"(?i)^\s*([A-Za-z0-9_%\-\s]+)\s+([0-9.]+%?)\s*$", token)
+                m = _KEY_SPACE_VALUE_RE.match(token)
             if not m:
                 continue
             norm_key = _normalize_key(m.group(1))
@@ -1,17 +1,20 @@
 from __future__ import annotations
 
+import inspect
 import os
 import sys
 from datetime import datetime, timezone
+from functools import lru_cache
 from io import StringIO
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 from urllib.parse import urlencode
 
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
+import numpy as np
 import pandas as pd
 import streamlit as st
 from streamlit.errors import StreamlitSecretNotFoundError
@@ -21,20 +24,37 @@ try:
 except Exception:  # pragma: no cover - fallback when altair is unavailable
     alt = None  # type: ignore[assignment]
 
+try:
+    import pyarrow  # noqa: F401
+
+    CSV_ENGINE = "pyarrow"
+except Exception:  # pragma: no cover - fallback when pyarrow is unavailable
+    CSV_ENGINE = "c"
+
 from statforge_core.consistency import compute_consistency
 from statforge_core.brand import APP_NAME, DISCLAIMER, TAGLINE
 from statforge_core.metrics import compute_catching_metrics, compute_hitting_metrics
 from statforge_core.pop_time import calculate_pop_metrics
 from statforge_core.recommendations import generate_recommendations
-from statforge_core.season_summary import compute_season_summary_metrics
 from statforge_core.suggestions import get_suggestions
 from statforge_core.video_protocols import compute_protocol_result, list_protocols_for_position, normalize_position
 from statforge_web.demo_data_loader import compute_or_map_metrics, load_demo_dataset
-from statforge_web.drill_library import DRILL_LIBRARY, filter_drill_library, match_library_drills
+from statforge_web.drill_library import DRILL_CATEGORIES, filter_drill_library, match_library_drills
 from statforge_web.drills import build_training_suggestions
-from statforge_web.ui_constants import APP_SIGNATURE, HELP_TEXT, METRIC_HELP, SECTION_GAP_MD
+from statforge_web.ui_constants import (
+    APP_SIGNATURE,
+    CARD_OPEN_MD,
+    CLOSE_DIV_MD,
+    HELP_TEXT,
+    METRIC_HELP,
+    SECTION_GAP_MD,
+    STANDOUT_CARD_OPEN_MD,
+)
 from statforge_web.ui_styles import get_app_css
 
+if int(pd.__version__.split(".", 1)[0]) < 3:
+    pd.set_option("mode.copy_on_write", True)
+
 DATA_DIR = Path(__file__).resolve().parent / "demo_data"
 NAV_SCREENS = [
     "Player",
@@ -69,6 +89,30 @@ METRIC_LABELS = {
     "cs_pct": "CS%",
     "pb_rate": "PB Rate",
 }
+PERCENT_METRIC_KEYS = frozenset({"k_rate", "bb_rate", "cs_pct", "pb_rate"})
+INVERSE_METRIC_KEYS = frozenset({"k_rate", "pb_rate"})
+WINDOW_TOTAL_COLUMNS = (
+    "ab",
+    "h",
+    "doubles",
+    "triples",
+    "hr",
+    "bb",
+    "so",
+    "rbi",
+    "sb",
+    "cs",
+    "innings_caught",
+    "passed_balls",
+    "sb_allowed",
+    "cs_caught",
+)
+TREND_DIRECTION = {1: "up", 0: "stable", -1: "down"}
+OPS_TREND_WORDING = {
+    1: ("up", "suggesting improved offensive efficiency."),
+    0: ("stable", "suggesting steady offensive efficiency."),
+    -1: ("down", "suggesting reduced offensive efficiency."),
+}
 DATE_COLUMNS = ("date", "game_date", "session_date", "event_date")
 TEAM_FILTER_KEY = "sidebar_team"
 PLAYER_FILTER_KEY = "sidebar_player"
@@ -78,23 +122,72 @@ NAV_FILTER_KEY = "sidebar_nav"
 RESET_FILTERS_KEY = "sidebar_reset_filters"
 COACH_NOTES_KEY = "coach_notes"
 COACH_MODE_KEY = "coach_mode"
-
-
-def _env_flag(name: str, default: bool = True) -> bool:
-    raw = os.getenv(name)
-    if raw is None:
-        return default
-    return str(raw).strip().lower() not in {"0", "false", "no", "off"}
-
-
-DEMO_MODE = _env_flag("STATFORGE_DEMO_MODE", default=True)
-
-
-def _query_param_value(name: str) -> str | None:
+TAB_DRAFTS_KEY = "tab_widget_drafts"
+QUICK_ENTRY_DEFAULTS: dict[str, Any] = {
+    "quick_entry_type": "Practice",
+    "quick_entry_opp": "",
+    "quick_entry_ab": 0,
+    "quick_entry_h": 0,
+    "quick_entry_bb": 0,
+    "quick_entry_so": 0,
+    "quick_entry_rbi": 0,
+    "quick_entry_sb": 0,
+    "quick_entry_cs": 0,
+    "quick_entry_ic": 0.0,
+    "quick_entry_pb": 0,
+    "quick_entry_pop": 0.0,
+    "quick_entry_pop_list": "",
+}
+TAB_WIDGET_KEYS = (
+    "quick_entry_date",
+    *QUICK_ENTRY_DEFAULTS,
+    "drill_category_filter",
+    "drill_search",
+    "trend_metric",
+    "trend_inseason_season",
+)
+TOP_HEADER_TEMPLATE = (
+    '<div class="sf-header"><div class="sf-header-top">'
+    f'<div class="sf-brand"><div class="sf-wordmark">{APP_NAME}</div>'
+    f'<div class="sf-tagline">{TAGLINE}</div>'
+    '<div class="sf-tagline-secondary">Demo • Read-only • Anonymized</div>'
+    f'<div class="sf-subtitle">{APP_SIGNATURE}</div></div>'
+    '<div class="sf-badge-row">'
+    '<span class="sf-badge">Demo</span>'
+    '<span class="sf-badge">Read-only</span>'
+    '<span class="sf-badge">Anonymized</span>'
+    '</div>'
+    '</div>'
+    '<div class="sf-context">'
+    '<span class="sf-chip">Team: {team}</span>'
+    '<span class="sf-chip">Player: {player}</span>'
+    '<span class="sf-chip">Position: {position}</span>'
+    '<span class="sf-chip">Level: {level}</span>'
+    '<span class="sf-chip">Season: {season}</span>'
+    '<span class="sf-chip">Game: {game}</span>'
+    '</div>'
+    '<div class="sf-trust-row">'
+    '<span>Last Updated: Demo Dataset Snapshot • Feb 2026</span>'
+    '<span>Last Refreshed: {refreshed}</span>'
+    '<span>Anonymized demo dataset</span>'
+    '<span>Logic Version • v0.9 (Preview)</span>'
+    '</div></div>'
+)
+
+
+LAZY_TABS = "on_change" in inspect.signature(st.tabs).parameters
+DEMO_MODE = os.getenv("STATFORGE_DEMO_MODE", "1").strip().lower() not in {"0", "false", "no", "off"}
+
+
+def _read_query_params() -> dict[str, Any]:
     try:
-        raw = st.query_params.get(name)
+        return dict(st.query_params)
     except Exception:
-        return None
+        return {}
+
+
+def _query_param_value(params: dict[str, Any], name: str) -> str | None:
+    raw = params.get(name)
     if raw is None:
         return None
     if isinstance(raw, list):
@@ -103,12 +196,12 @@ def _query_param_value(name: str) -> str | None:
 
 
 def _safe_default_from_query(
-    key: str, options: list[str], default: str, query_name: str | None = None
+    key: str, options: list[str], default: str, params: dict[str, Any], query_name: str | None = None
 ) -> str:
     current = st.session_state.get(key)
     if current in options:
         return str(current)
-    query_val = _query_param_value(query_name or key)
+    query_val = _query_param_value(params, query_name or key)
     if query_val in options:
         st.session_state[key] = query_val
         return query_val
@@ -216,13 +309,71 @@ def _load_demo_data() -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, pd.Data
     if dataset_path.exists():
         dataset = load_demo_dataset(path=dataset_path)
         mapped = compute_or_map_metrics(dataset, filters=None)
-        return mapped["players"], mapped["games"], mapped["practice"], mapped["season_summaries"]
+        games = _downcast_ints(_parse_date_columns(_string_season_labels(mapped["games"])))
+        practice = _downcast_ints(_parse_date_columns(_string_season_labels(mapped["practice"])))
+        summaries = _downcast_ints(_string_season_labels(mapped["season_summaries"]))
+        players = _categorize_teams(mapped["players"])
+        return players, _index_games(games), practice, summaries
+
+    players = _categorize_teams(pd.read_csv(DATA_DIR / "players.csv", engine=CSV_ENGINE))
+    games = _downcast_ints(
+        _parse_date_columns(_string_season_labels(pd.read_csv(DATA_DIR / "games.csv", engine=CSV_ENGINE)))
+    )
+    practice = _downcast_ints(
+        _parse_date_columns(_string_season_labels(pd.read_csv(DATA_DIR / "practice.csv", engine=CSV_ENGINE)))
+    )
+    season_summaries = _downcast_ints(
+        _string_season_labels(pd.read_csv(DATA_DIR / "season_summaries.csv", engine=CSV_ENGINE))
+    )
+    return players, _index_games(games), practice, season_summaries
+
+
+def _categorize_teams(players: pd.DataFrame) -> pd.DataFrame:
+    if "team" not in players.columns:
+        return players
+    return players.astype({"team": "category"})
+
+
+def _downcast_ints(df: pd.DataFrame) -> pd.DataFrame:
+    int_cols = df.select_dtypes(include="int64").columns
+    return df.astype(dict.fromkeys(int_cols, np.int32)) if len(int_cols) else df
+
 
-    players = pd.read_csv(DATA_DIR / "players.csv")
-    games = pd.read_csv(DATA_DIR / "games.csv")
-    practice = pd.read_csv(DATA_DIR / "practice.csv")
-    season_summaries = pd.read_csv(DATA_DIR / "season_summaries.csv")
-    return players, games, practice, season_summaries
+def _string_season_labels(df: pd.DataFrame) -> pd.DataFrame:
+    if "season_label" not in df.columns:
+        return df
+    return df.assign(season_label=df["season_label"].astype(str))
+
+
+def _parse_date_columns(df: pd.DataFrame) -> pd.DataFrame:
+    parsed = {col: pd.to_datetime(df[col], errors="coerce") for col in DATE_COLUMNS if col in df.columns}
+    return df.assign(**parsed) if parsed else df
+
+
+def _date_column(df: pd.DataFrame) -> str | None:
+    return next((col for col in DATE_COLUMNS if col in df.columns), None)
+
+
+def _index_games(games: pd.DataFrame) -> pd.DataFrame:
+    # Unnamed levels keep "player_id"/"season_label" unambiguous as column labels.
+    index = pd.MultiIndex.from_arrays(
+        [games["player_id"].astype(int), games["season_label"]], names=[None, None]
+    )
+    return games.set_axis(index).sort_index()
+
+
+def _games_for_player(games: pd.DataFrame, player_id: int) -> pd.DataFrame:
+    try:
+        return games.loc[[player_id]]
+    except KeyError:
+        return games.iloc[0:0]
+
+
+def _games_for_season(player_games: pd.DataFrame, season: str) -> pd.DataFrame:
+    try:
+        return player_games.xs(season, level=1, drop_level=False)
+    except KeyError:
+        return player_games.iloc[0:0]
 
 
 def _fmt_rate(value: float | None, places: int = 3) -> str:
@@ -274,15 +425,29 @@ def _reset_filters_state() -> None:
         "trend_inseason_season",
         "drill_category_filter",
     ]
+    drafts = st.session_state.get(TAB_DRAFTS_KEY, {})
     for key in reset_keys:
         if key in st.session_state:
             del st.session_state[key]
+        drafts.pop(key, None)
     try:
         st.query_params.clear()
     except Exception:
         pass
 
 
+def _save_tab_widget_drafts() -> None:
+    drafts = st.session_state.setdefault(TAB_DRAFTS_KEY, {})
+    drafts.update({key: st.session_state[key] for key in TAB_WIDGET_KEYS if key in st.session_state})
+
+
+def _seed_tab_widgets(defaults: dict[str, Any]) -> None:
+    drafts = st.session_state.get(TAB_DRAFTS_KEY, {})
+    for key, default in defaults.items():
+        if key not in st.session_state:
+            st.session_state[key] = drafts.get(key, default)
+
+
 def _render_empty_state(message: str, hint: str, button_key: str) -> None:
     st.info(message)
     st.caption(hint)
@@ -292,7 +457,7 @@ def _render_empty_state(message: str, hint: str, button_key: str) -> None:
 
 
 def _fmt_metric_for_table(metric_key: str, value: float | None) -> str:
-    if metric_key in {"k_rate", "bb_rate", "cs_pct", "pb_rate"}:
+    if metric_key in PERCENT_METRIC_KEYS:
         return _fmt_percent(value)
     return _fmt_rate(value)
 
@@ -310,23 +475,18 @@ def _window_metrics(window_games: pd.DataFrame) -> dict[str, float | None]:
             "pb_rate": None,
         }
 
-    totals = {
-        "ab": float(window_games["ab"].sum()),
-        "h": float(window_games["h"].sum()),
-        "doubles": float(window_games["doubles"].sum()),
-        "triples": float(window_games["triples"].sum()),
-        "hr": float(window_games["hr"].sum()),
-        "bb": float(window_games["bb"].sum()),
-        "so": float(window_games["so"].sum()),
-        "rbi": float(window_games["rbi"].sum()),
-        "sb": float(window_games["sb"].sum()),
-        "cs": float(window_games["cs"].sum()),
-        "innings_caught": float(window_games["innings_caught"].sum()),
-        "passed_balls": float(window_games["passed_balls"].sum()),
-        "sb_allowed": float(window_games["sb_allowed"].sum()),
-        "cs_caught": float(window_games["cs_caught"].sum()),
-    }
+    return _metrics_from_totals(_window_totals(_window_values(window_games)))
+
+
+def _window_values(window_games: pd.DataFrame) -> np.ndarray:
+    return window_games[list(WINDOW_TOTAL_COLUMNS)].to_numpy(dtype=np.float64, na_value=np.nan)
+
+
+def _window_totals(values: np.ndarray) -> dict[str, float]:
+    return dict(zip(WINDOW_TOTAL_COLUMNS, np.nansum(values, axis=0).tolist()))
+
 
+def _metrics_from_totals(totals: dict[str, float]) -> dict[str, float | None]:
     hitting = compute_hitting_metrics(totals)
     catching = compute_catching_metrics(totals)
     pa = totals["ab"] + totals["bb"]
@@ -343,32 +503,147 @@ def _window_metrics(window_games: pd.DataFrame) -> dict[str, float | None]:
     }
 
 
+def _ratio(num: np.ndarray, den: np.ndarray, empty: float = 0.0) -> np.ndarray:
+    return np.divide(num, den, out=np.full_like(den, empty), where=den > 0)
+
+
+def _hitting_rates(
+    ab: np.ndarray,
+    h: np.ndarray,
+    doubles: np.ndarray,
+    triples: np.ndarray,
+    hr: np.ndarray,
+    bb: np.ndarray,
+    so: np.ndarray,
+    empty: float = 0.0,
+    clip_singles: bool = False,
+) -> dict[str, np.ndarray]:
+    singles = h - doubles - triples - hr
+    if clip_singles:
+        singles = np.maximum(singles, 0.0)
+    tb = singles + (2 * doubles) + (3 * triples) + (4 * hr)
+    pa = ab + bb
+    obp = _ratio(h + bb, pa, empty)
+    slg = _ratio(tb, ab, empty)
+    return {
+        "avg": _ratio(h, ab, empty),
+        "obp": obp,
+        "slg": slg,
+        "ops": obp + slg,
+        "k_rate": _ratio(so, pa, empty),
+        "bb_rate": _ratio(bb, pa, empty),
+    }
+
+
+def _metrics_frame_from_totals(totals: pd.DataFrame) -> pd.DataFrame:
+    cs_caught, sb_allowed, passed_balls, innings = (
+        totals[col].to_numpy(dtype=np.float64) for col in ("cs_caught", "sb_allowed", "passed_balls", "innings_caught")
+    )
+    rates = _hitting_rates(
+        *(totals[col].to_numpy(dtype=np.float64) for col in ("ab", "h", "doubles", "triples", "hr", "bb", "so"))
+    )
+    rates["cs_pct"] = _ratio(cs_caught, sb_allowed)
+    rates["pb_rate"] = _ratio(passed_balls, innings)
+    return pd.DataFrame(rates, index=totals.index)
+
+
+@lru_cache(maxsize=64)
+def _cached_consistency(samples: tuple[float, ...]) -> dict[str, Any]:
+    return compute_consistency(list(samples))
+
+
+def _consistency(samples: list[float]) -> dict[str, Any] | None:
+    return _cached_consistency(tuple(samples)) if len(samples) >= 2 else None
+
+
+def _per_game_obp_samples(games: pd.DataFrame) -> list[float]:
+    ab = games["ab"].to_numpy(dtype=np.float64)
+    bb = games["bb"].to_numpy(dtype=np.float64)
+    h = games["h"].to_numpy(dtype=np.float64)
+    denom = ab + bb
+    valid = denom > 0
+    return ((h[valid] + bb[valid]) / denom[valid]).tolist()
+
+
+def _per_game_ops_k_rate(games: pd.DataFrame) -> tuple[np.ndarray, np.ndarray]:
+    rates = _hitting_rates(
+        *(games[col].to_numpy(dtype=np.float64) for col in ("ab", "h", "doubles", "triples", "hr", "bb", "so"))
+    )
+    return rates["ops"], rates["k_rate"]
+
+
+def _season_summary_metrics_frame(summaries_df: pd.DataFrame, include_timing: bool = False) -> pd.DataFrame:
+    def col(name: str) -> np.ndarray:
+        if name not in summaries_df.columns:
+            return np.zeros(len(summaries_df))
+        return summaries_df[name].to_numpy(dtype=np.float64)
+
+    rates = _hitting_rates(
+        *(col(name) for name in ("ab", "h", "doubles", "triples", "hr", "bb", "so")), empty=np.nan, clip_singles=True
+    )
+    metrics = {
+        "avg": rates["avg"],
+        "slg": rates["slg"],
+        "obp": rates["obp"],
+        "ops": rates["ops"],
+        "k_pct": rates["k_rate"],
+        "bb_pct": rates["bb_rate"],
+        "pb_per_inning": _ratio(col("pb"), col("innings_caught"), np.nan),
+        "cs_rate": _ratio(col("cs"), col("sb_allowed"), np.nan),
+    }
+    if include_timing:
+        metrics["transfer_time"] = col("transfer_time")
+        metrics["pop_time"] = col("pop_time")
+    return pd.DataFrame(metrics, index=summaries_df.index).dropna(axis=1, how="all")
+
+
+def _stat_windows(games_sorted: pd.DataFrame) -> dict[str, dict[str, float | None]]:
+    if games_sorted.empty:
+        return {window: _window_metrics(games_sorted) for window in ("season", "last5", "last10")}
+    values = _window_values(games_sorted)
+    return {
+        "season": _metrics_from_totals(_window_totals(values)),
+        "last5": _metrics_from_totals(_window_totals(values[:5])),
+        "last10": _metrics_from_totals(_window_totals(values[:10])),
+    }
+
+
+def _practice_timings(practice_df: pd.DataFrame) -> pd.DataFrame:
+    if practice_df.empty:
+        return pd.DataFrame({"transfer_time": pd.Series(dtype=float), "pop_time": pd.Series(dtype=float)})
+    latest = practice_df[["season_label", "session_no"]].sort_values(
+        ["season_label", "session_no"], ascending=[False, False]
+    )
+    return practice_df.loc[latest.index, ["transfer_time", "pop_time"]].astype(float)
+
+
 def _build_recommendation_metrics(
     games_sorted: pd.DataFrame,
     practice_df: pd.DataFrame,
+    windows: dict[str, dict[str, float | None]] | None = None,
+    timings: pd.DataFrame | None = None,
 ) -> dict[str, float | None]:
-    season_metrics = _window_metrics(games_sorted)
-    last5_metrics = _window_metrics(games_sorted.head(5))
-    last10_metrics = _window_metrics(games_sorted.head(10))
-
-    practice_sorted = practice_df.sort_values(["season_label", "session_no"], ascending=[False, False])
-    transfer_avg = practice_sorted["transfer_time"].astype(float).mean() if not practice_sorted.empty else None
-    pop_avg = practice_sorted["pop_time"].astype(float).mean() if not practice_sorted.empty else None
-    transfer_last5 = practice_sorted.head(5)["transfer_time"].astype(float).mean() if not practice_sorted.empty else None
-    pop_last5 = practice_sorted.head(5)["pop_time"].astype(float).mean() if not practice_sorted.empty else None
-
-    transfer_samples = practice_sorted["transfer_time"].dropna().astype(float).tolist() if not practice_sorted.empty else []
-    obp_samples: list[float] = []
-    for _, row in games_sorted.iterrows():
-        ab = float(row["ab"])
-        bb = float(row["bb"])
-        h = float(row["h"])
-        denom = ab + bb
-        if denom > 0:
-            obp_samples.append((h + bb) / denom)
-
-    transfer_cons = compute_consistency(transfer_samples) if len(transfer_samples) >= 2 else None
-    obp_cons = compute_consistency(obp_samples) if len(obp_samples) >= 2 else None
+    if windows is None:
+        windows = _stat_windows(games_sorted)
+    if timings is None:
+        timings = _practice_timings(practice_df)
+    season_metrics = windows["season"]
+    last5_metrics = windows["last5"]
+    last10_metrics = windows["last10"]
+
+    transfer_avg = pop_avg = transfer_last5 = pop_last5 = None
+    transfer_samples: list[float] = []
+    if not timings.empty:
+        recent = timings.head(5)
+        transfer_avg = timings["transfer_time"].mean()
+        pop_avg = timings["pop_time"].mean()
+        transfer_last5 = recent["transfer_time"].mean()
+        pop_last5 = recent["pop_time"].mean()
+        transfer_samples = timings["transfer_time"].dropna().tolist()
+    obp_samples = _per_game_obp_samples(games_sorted)
+
+    transfer_cons = _consistency(transfer_samples)
+    obp_cons = _consistency(obp_samples)
 
     return {
         "avg_season": season_metrics["avg"],
@@ -416,6 +691,88 @@ def _build_recommendation_metrics(
     }
 
 
+def _scope_key(ctx: dict[str, Any]) -> tuple[int, str, tuple[str, str] | None]:
+    date_range = ctx.get("date_range")
+    date_key = None if not date_range else (date_range[0].isoformat(), date_range[1].isoformat())
+    return int(ctx["player_id"]), str(ctx["season"]), date_key
+
+
+@st.cache_resource(show_spinner=False)
+def _row_partitions(frame_name: str) -> tuple[dict[Any, np.ndarray], dict[Any, np.ndarray]]:
+    _, _, practice, summaries = _load_demo_data()
+    df = practice if frame_name == "practice" else summaries
+    if df.empty:
+        return {}, {}
+    return (
+        df.groupby("player_id", sort=False).indices,
+        df.groupby(["player_id", "season_label"], sort=False).indices,
+    )
+
+
+def _take_partition(df: pd.DataFrame, partitions: dict[Any, np.ndarray], key: Any) -> pd.DataFrame:
+    rows = partitions.get(key)
+    return df.iloc[0:0] if rows is None else df.iloc[rows]
+
+
+@st.cache_resource(show_spinner=False, max_entries=64)
+def _scope_frames(
+    scope_key: tuple[Any, ...], _player_games: pd.DataFrame, _practice: pd.DataFrame, _summaries: pd.DataFrame
+) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    # Shared read-only frames; callers must not mutate the slices.
+    player_id, season, date_key = scope_key
+    practice_by_player, practice_by_season = _row_partitions("practice")
+    summaries_by_player, summaries_by_season = _row_partitions("season_summaries")
+    if season == "All":
+        scoped_games = _player_games
+        scoped_practice = _take_partition(_practice, practice_by_player, player_id)
+        scoped_summaries = _take_partition(_summaries, summaries_by_player, player_id)
+    else:
+        scoped_games = _games_for_season(_player_games, season)
+        scoped_practice = _take_partition(_practice, practice_by_season, (player_id, season))
+        scoped_summaries = _take_partition(_summaries, summaries_by_season, (player_id, season))
+
+    if date_key:
+        start, end = (pd.Timestamp(value) for value in date_key)
+        games_date_col = _date_column(scoped_games)
+        if games_date_col:
+            scoped_games = scoped_games.loc[scoped_games[games_date_col].between(start, end, inclusive="both")]
+        practice_date_col = _date_column(scoped_practice)
+        if practice_date_col:
+            scoped_practice = scoped_practice.loc[scoped_practice[practice_date_col].between(start, end, inclusive="both")]
+    return scoped_games, scoped_practice, scoped_summaries
+
+
+@st.cache_resource(show_spinner=False, max_entries=64)
+def _cached_games_newest_first(scope_key: tuple[Any, ...], _games: pd.DataFrame) -> pd.DataFrame:
+    # Shared read-only frame; callers must not mutate it.
+    return _games.sort_values(["season_label", "game_no"], ascending=[False, False])
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _cached_stat_windows(scope_key: tuple[Any, ...], _games_sorted: pd.DataFrame) -> dict[str, dict[str, float | None]]:
+    return _stat_windows(_games_sorted)
+
+
+@st.cache_resource(show_spinner=False, max_entries=64)
+def _cached_practice_timings(scope_key: tuple[Any, ...], _practice_df: pd.DataFrame) -> pd.DataFrame:
+    # Shared read-only frame; callers must not mutate it.
+    return _practice_timings(_practice_df)
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _cached_recommendation_metrics(
+    scope_key: tuple[Any, ...],
+    _games_sorted: pd.DataFrame,
+    _practice_df: pd.DataFrame,
+) -> dict[str, float | None]:
+    return _build_recommendation_metrics(
+        _games_sorted,
+        _practice_df,
+        windows=_cached_stat_windows(scope_key, _games_sorted),
+        timings=_cached_practice_timings(scope_key, _practice_df),
+    )
+
+
 def _delta_label(delta: float | None, inverse_better: bool = False, suffix: str = "") -> str:
     if delta is None:
         return "stable"
@@ -443,41 +800,59 @@ def _build_filtered_export_frame(
         ),
         "coach_notes": str(ctx.get("coach_notes", "")),
     }
-    frames: list[pd.DataFrame] = []
-    for source, df in [
-        ("games", games_df.copy()),
-        ("practice", practice_df.copy()),
-        ("season_summaries", summaries_df.copy()),
-    ]:
-        if df.empty:
-            continue
-        enriched = df.copy()
-        enriched.insert(0, "source", source)
-        for k, v in filter_meta.items():
-            enriched[k] = v
-        frames.append(enriched)
+    frames = {
+        source: df
+        for source, df in (("games", games_df), ("practice", practice_df), ("season_summaries", summaries_df))
+        if not df.empty
+    }
     if not frames:
         return pd.DataFrame([{"source": "empty", **filter_meta}])
-    return pd.concat(frames, ignore_index=True, sort=False)
+    labeled = pd.concat(frames.values(), ignore_index=True, sort=False)
+    labeled.insert(0, "source", np.repeat(list(frames), [len(df) for df in frames.values()]))
+    # Keep the established export layout: filter columns follow the first frame's columns,
+    # ahead of any columns only the later frames carry.
+    first_columns = ["source", *next(iter(frames.values())).columns, *filter_meta]
+    columns = list(dict.fromkeys([*first_columns, *labeled.columns]))
+    return labeled.assign(**filter_meta).reindex(columns=columns)
 
 
-def _build_export_csv(ctx: dict[str, Any], games_df: pd.DataFrame, practice_df: pd.DataFrame, summaries_df: pd.DataFrame) -> str:
-    export_df = _build_filtered_export_frame(ctx, games_df, practice_df, summaries_df)
-    timestamp = datetime.now(timezone.utc).isoformat()
-    date_range = ctx.get("date_range")
+def _export_key(ctx: dict[str, Any]) -> tuple[Any, ...]:
+    return (
+        *_scope_key(ctx),
+        str(ctx.get("team", "All Teams")),
+        str(ctx["selected_game_label"]),
+        str(ctx.get("coach_notes", "")),
+    )
+
+
+@st.cache_data(show_spinner=False, ttl=60)
+def _cached_export_csv(
+    export_key: tuple[Any, ...],
+    _ctx: dict[str, Any],
+    _games_df: pd.DataFrame,
+    _practice_df: pd.DataFrame,
+    _summaries_df: pd.DataFrame,
+) -> bytes:
+    export_df = _build_filtered_export_frame(_ctx, _games_df, _practice_df, _summaries_df)
+    date_range = _ctx.get("date_range")
     date_txt = "All" if not date_range else f"{date_range[0].date().isoformat()} to {date_range[1].date().isoformat()}"
     header_lines = [
-        f"# Export generated_at_utc: {timestamp}",
-        f"# Filter team: {ctx.get('team', 'All Teams')}",
-        f"# Filter player: {ctx['player']['player_name']}",
-        f"# Filter season: {ctx['season']}",
-        f"# Filter game: {ctx['selected_game_label']}",
+        f"# Filter team: {_ctx.get('team', 'All Teams')}",
+        f"# Filter player: {_ctx['player']['player_name']}",
+        f"# Filter season: {_ctx['season']}",
+        f"# Filter game: {_ctx['selected_game_label']}",
         f"# Filter date_range: {date_txt}",
-        f"# Coach notes: {str(ctx.get('coach_notes', '')).strip() or '(none)'}",
+        f"# Coach notes: {str(_ctx.get('coach_notes', '')).strip() or '(none)'}",
     ]
     buffer = StringIO()
-    export_df.to_csv(buffer, index=False)
-    return "\n".join(header_lines) + "\n" + buffer.getvalue()
+    buffer.writelines(f"{line}\n" for line in header_lines)
+    export_df.to_csv(buffer, index=False, chunksize=10_000)
+    return buffer.getvalue().encode("utf-8")
+
+
+def _build_export_csv(ctx: dict[str, Any], games_df: pd.DataFrame, practice_df: pd.DataFrame, summaries_df: pd.DataFrame) -> bytes:
+    generated = f"# Export generated_at_utc: {datetime.now(timezone.utc).isoformat()}\n".encode("utf-8")
+    return generated + _cached_export_csv(_export_key(ctx), ctx, games_df, practice_df, summaries_df)
 
 
 def _render_sidebar_filters_summary(ctx: dict[str, Any], games_df: pd.DataFrame) -> None:
@@ -571,49 +946,64 @@ def _render_drill_library_matches(query: str, category: str | None = None, max_i
             st.write(f"**Equipment:** {drill['equipment']}")
 
 
+@st.cache_data(show_spinner=False)
+def _team_options() -> tuple[str, ...]:
+    players = _load_demo_data()[0]
+    if "team" in players.columns and not players["team"].dropna().empty:
+        return tuple(sorted(players["team"].dropna().astype(str).unique().tolist()))
+    return ("All Teams",)
+
+
+@st.cache_data(show_spinner=False)
+def _season_options_by_player() -> dict[int, tuple[str, ...]]:
+    games = _load_demo_data()[1]
+    seasons = games[["player_id", "season_label"]].dropna().astype({"player_id": int, "season_label": str})
+    return {
+        int(player_id): tuple(sorted(labels.unique().tolist()))
+        for player_id, labels in seasons.groupby("player_id")["season_label"]
+    }
+
+
 def _build_sidebar(players: pd.DataFrame, games: pd.DataFrame) -> dict[str, Any]:
+    params = _read_query_params()
     st.sidebar.markdown("### StatForge Demo")
     st.sidebar.caption("Executive coaching workspace")
     st.sidebar.markdown('<div class="sf-demo-mode-pill">Demo Mode • Read-only</div>', unsafe_allow_html=True)
 
-    if "team" in players.columns and not players["team"].dropna().empty:
-        team_options = sorted(players["team"].dropna().astype(str).unique().tolist())
-    else:
-        team_options = ["All Teams"]
+    team_options = list(_team_options())
     default_team = team_options[0] if team_options else "All Teams"
-    _safe_default_from_query(TEAM_FILTER_KEY, team_options, default_team, query_name="team")
+    _safe_default_from_query(TEAM_FILTER_KEY, team_options, default_team, params, query_name="team")
     team_name = st.sidebar.selectbox("Team", options=team_options, key=TEAM_FILTER_KEY)
 
     if "team" in players.columns and team_name != "All Teams":
-        team_players = players.loc[players["team"].astype(str) == str(team_name)].copy()
+        team_players = players.loc[players["team"] == str(team_name)]
         if team_players.empty:
             st.sidebar.caption("Demo dataset limitation: selected team has no players in this sample.")
-            team_players = players.copy()
+            team_players = players
     else:
-        team_players = players.copy()
+        team_players = players
 
     player_options = team_players["player_name"].tolist()
     default_player = player_options[0] if player_options else ""
-    _safe_default_from_query(PLAYER_FILTER_KEY, player_options, default_player, query_name="player")
+    _safe_default_from_query(PLAYER_FILTER_KEY, player_options, default_player, params, query_name="player")
     player_name = st.sidebar.selectbox("Player", options=player_options, key=PLAYER_FILTER_KEY)
     player_row = team_players.loc[team_players["player_name"] == player_name].iloc[0]
     player_id = int(player_row["player_id"])
 
-    player_games = games.loc[games["player_id"] == player_id].copy()
-    seasons = sorted(player_games["season_label"].dropna().astype(str).unique().tolist())
-    season_options = ["All"] + seasons
-    _safe_default_from_query(SEASON_FILTER_KEY, season_options, "All", query_name="season")
+    player_games = _games_for_player(games, player_id)
+    season_options = ["All", *_season_options_by_player().get(player_id, ())]
+    _safe_default_from_query(SEASON_FILTER_KEY, season_options, "All", params, query_name="season")
     season = st.sidebar.selectbox("Season", options=season_options, key=SEASON_FILTER_KEY)
 
     if season != "All":
-        scoped_games = player_games.loc[player_games["season_label"].astype(str) == season].copy()
+        scoped_games = _games_for_season(player_games, season)
     else:
-        scoped_games = player_games.copy()
+        scoped_games = player_games
 
-    date_col = next((col for col in DATE_COLUMNS if col in scoped_games.columns), None)
+    date_col = _date_column(scoped_games)
     date_range: tuple[pd.Timestamp, pd.Timestamp] | None = None
     if date_col:
-        parsed_dates = pd.to_datetime(scoped_games[date_col], errors="coerce").dropna()
+        parsed_dates = scoped_games[date_col].dropna()
         if not parsed_dates.empty:
             min_date = parsed_dates.min().date()
             max_date = parsed_dates.max().date()
@@ -626,32 +1016,30 @@ def _build_sidebar(players: pd.DataFrame, games: pd.DataFrame) -> dict[str, Any]
             if isinstance(selected_dates, tuple) and len(selected_dates) == 2:
                 start, end = selected_dates
                 date_range = (pd.Timestamp(start), pd.Timestamp(end))
-                scoped_games = scoped_games.assign(
-                    _parsed_date=pd.to_datetime(scoped_games[date_col], errors="coerce")
-                )
                 scoped_games = scoped_games.loc[
-                    scoped_games["_parsed_date"].between(date_range[0], date_range[1], inclusive="both")
-                ].drop(columns=["_parsed_date"])
+                    scoped_games[date_col].between(date_range[0], date_range[1], inclusive="both")
+                ]
         else:
             st.sidebar.caption("Demo dataset limitation: date range is unavailable in this sample.")
     else:
         st.sidebar.caption("Demo dataset limitation: date range is unavailable in this sample.")
 
     scoped_games = scoped_games.sort_values(["season_label", "game_no"], ascending=[False, False])
-    game_options = ["All"] + [
-        f"{row['season_label']} • Game {int(row['game_no'])}" for _, row in scoped_games.iterrows()
-    ]
-    _safe_default_from_query(GAME_FILTER_KEY, game_options, "All", query_name="game")
+    game_labels = (
+        scoped_games["season_label"] + " • Game " + scoped_games["game_no"].astype("int64").astype(str)
+    )
+    game_options = ["All", *game_labels.tolist()]
+    _safe_default_from_query(GAME_FILTER_KEY, game_options, "All", params, query_name="game")
     selected_game_label = st.sidebar.selectbox("Game", options=game_options, key=GAME_FILTER_KEY)
 
     nav_options = [f"{NAV_ICONS.get(screen, '')} {screen}" for screen in NAV_SCREENS]
     default_nav = f"{NAV_ICONS.get('Dashboard', '')} Dashboard"
-    section_from_query = _query_param_value("section")
+    section_from_query = _query_param_value(params, "section")
     if section_from_query:
         section_candidate = f"{NAV_ICONS.get(section_from_query, '')} {section_from_query}"
         if section_candidate in nav_options:
             st.session_state[NAV_FILTER_KEY] = section_candidate
-    _safe_default_from_query(NAV_FILTER_KEY, nav_options, default_nav, query_name="section")
+    _safe_default_from_query(NAV_FILTER_KEY, nav_options, default_nav, params, query_name="section")
     tk_screen_with_icon = st.sidebar.selectbox(
         "Navigation",
         options=nav_options,
@@ -699,32 +1087,14 @@ def _render_top_header(ctx: dict[str, Any]) -> None:
     game = ctx["selected_game_label"]
     refreshed = datetime.now().strftime("%b %d, %Y %I:%M %p")
     st.markdown(
-        (
-            '<div class="sf-header"><div class="sf-header-top">'
-            f'<div class="sf-brand"><div class="sf-wordmark">{APP_NAME}</div>'
-            f'<div class="sf-tagline">{TAGLINE}</div>'
-            '<div class="sf-tagline-secondary">Demo • Read-only • Anonymized</div>'
-            f'<div class="sf-subtitle">{APP_SIGNATURE}</div></div>'
-            '<div class="sf-badge-row">'
-            '<span class="sf-badge">Demo</span>'
-            '<span class="sf-badge">Read-only</span>'
-            '<span class="sf-badge">Anonymized</span>'
-            '</div>'
-            '</div>'
-            '<div class="sf-context">'
-            f'<span class="sf-chip">Team: {team}</span>'
-            f'<span class="sf-chip">Player: {player["player_name"]}</span>'
-            f'<span class="sf-chip">Position: {player["position"]}</span>'
-            f'<span class="sf-chip">Level: {player["level"]}</span>'
-            f'<span class="sf-chip">Season: {season}</span>'
-            f'<span class="sf-chip">Game: {game}</span>'
-            '</div>'
-            '<div class="sf-trust-row">'
-            '<span>Last Updated: Demo Dataset Snapshot • Feb 2026</span>'
-            f'<span>Last Refreshed: {refreshed}</span>'
-            '<span>Anonymized demo dataset</span>'
-            '<span>Logic Version • v0.9 (Preview)</span>'
-            '</div></div>'
+        TOP_HEADER_TEMPLATE.format(
+            team=team,
+            player=player["player_name"],
+            position=player["position"],
+            level=player["level"],
+            season=season,
+            game=game,
+            refreshed=refreshed,
         ),
         unsafe_allow_html=True,
     )
@@ -758,9 +1128,11 @@ def _render_desktop_comparison_panel() -> None:
         )
 
 
-def _build_coach_summary_text(ctx: dict[str, Any], scoped_games: pd.DataFrame, scoped_practice: pd.DataFrame) -> str:
-    season_metrics = _window_metrics(scoped_games)
-    metric_pack = _build_recommendation_metrics(scoped_games, scoped_practice)
+def _build_coach_summary_text(ctx: dict[str, Any], scoped_practice: pd.DataFrame) -> str:
+    scope_key = _scope_key(ctx)
+    games_sorted = ctx["scoped_games_sorted"]
+    season_metrics = _cached_stat_windows(scope_key, games_sorted)["season"]
+    metric_pack = _cached_recommendation_metrics(scope_key, games_sorted, scoped_practice)
     recs = generate_recommendations(metric_pack, max_items=1)
     top_focus = recs[0].title if recs else "Maintain consistency and monitor trends"
     drill_lines: list[str] = []
@@ -794,7 +1166,7 @@ def _build_coach_summary_text(ctx: dict[str, Any], scoped_games: pd.DataFrame, s
     return "\n".join(lines)
 
 
-def _render_header_actions(ctx: dict[str, Any], scoped_games: pd.DataFrame, scoped_practice: pd.DataFrame) -> None:
+def _render_header_actions(ctx: dict[str, Any], scoped_practice: pd.DataFrame) -> None:
     c1, c2 = st.columns([1, 2], gap="small")
     with c1:
         st.toggle(
@@ -803,97 +1175,86 @@ def _render_header_actions(ctx: dict[str, Any], scoped_games: pd.DataFrame, scop
             help="Prioritize summary and quick actions while keeping all sections accessible.",
         )
     with c2:
-        if st.button("Copy Coach Summary", key="copy_coach_summary_btn"):
-            st.session_state["coach_summary_text"] = _build_coach_summary_text(ctx, scoped_games, scoped_practice)
-    coach_text = st.session_state.get("coach_summary_text", "")
+        summary_key = (*_scope_key(ctx), str(ctx.get("team", "All Teams")), str(ctx["selected_game_label"]))
+        rebuild = st.button("Copy Coach Summary", key="copy_coach_summary_btn")
+    coach_text = ""
+    if "coach_summary_text" in st.session_state:
+        built_for, coach_text = st.session_state["coach_summary_text"]
+        rebuild = rebuild or built_for != summary_key
+    if rebuild:
+        coach_text = _build_coach_summary_text(ctx, scoped_practice)
+        st.session_state["coach_summary_text"] = (summary_key, coach_text)
+        st.session_state["coach_summary_output"] = coach_text
     if coach_text:
         st.text_area(
             "Coach Summary (copy using the clipboard icon)",
-            value=coach_text,
             height=180,
             key="coach_summary_output",
         )
 
 
+def _prefix_means(values: pd.Series, sizes: tuple[int, ...]) -> list[float]:
+    arr = values.to_numpy(dtype=np.float64)
+    sums = np.nancumsum(arr)
+    counts = np.cumsum(~np.isnan(arr))
+    means: list[float] = []
+    for size in sizes:
+        idx = min(size, len(arr)) - 1
+        means.append(float(sums[idx] / counts[idx]) if counts[idx] else float("nan"))
+    return means
+
+
 def _render_kpi_cards(
     season_metrics: dict[str, float | None],
     last5_metrics: dict[str, float | None],
     last10_metrics: dict[str, float | None],
-    practice_df: pd.DataFrame,
+    practice_timings: pd.DataFrame,
 ) -> None:
-    st.markdown('<div class="sf-card">', unsafe_allow_html=True)
+    st.markdown(CARD_OPEN_MD, unsafe_allow_html=True)
     st.markdown('<div class="sf-card-title">Key KPIs</div>', unsafe_allow_html=True)
     st.markdown(
         '<div class="sf-card-subtitle">Season baseline with recent movement against last 5 and last 10 samples.</div>',
         unsafe_allow_html=True,
     )
-    practice_sorted = practice_df.sort_values(["season_label", "session_no"], ascending=[False, False])
-    transfer_avg = practice_sorted["transfer_time"].astype(float).mean() if not practice_sorted.empty else None
-    pop_avg = practice_sorted["pop_time"].astype(float).mean() if not practice_sorted.empty else None
-    transfer_last5 = practice_sorted.head(5)["transfer_time"].astype(float).mean() if not practice_sorted.empty else None
-    transfer_last10 = practice_sorted.head(10)["transfer_time"].astype(float).mean() if not practice_sorted.empty else None
-    pop_last5 = practice_sorted.head(5)["pop_time"].astype(float).mean() if not practice_sorted.empty else None
-    pop_last10 = practice_sorted.head(10)["pop_time"].astype(float).mean() if not practice_sorted.empty else None
-
-    cards = [
-        {
-            "label": "AVG",
-            "help": METRIC_HELP["avg"],
-            "value": _fmt_rate(season_metrics["avg"]),
-            "delta5": None
-            if last5_metrics["avg"] is None or season_metrics["avg"] is None
-            else float(last5_metrics["avg"]) - float(season_metrics["avg"]),
-            "delta10": None
-            if last10_metrics["avg"] is None or season_metrics["avg"] is None
-            else float(last10_metrics["avg"]) - float(season_metrics["avg"]),
-        },
-        {
-            "label": "OPS",
-            "help": METRIC_HELP["ops"],
-            "value": _fmt_rate(season_metrics["ops"]),
-            "delta5": None
-            if last5_metrics["ops"] is None or season_metrics["ops"] is None
-            else float(last5_metrics["ops"]) - float(season_metrics["ops"]),
-            "delta10": None
-            if last10_metrics["ops"] is None or season_metrics["ops"] is None
-            else float(last10_metrics["ops"]) - float(season_metrics["ops"]),
-        },
-        {
-            "label": "Exchange (s)",
-            "help": METRIC_HELP["exchange"],
-            "value": _fmt_float(transfer_avg),
-            "delta5": None if transfer_last5 is None or transfer_avg is None else float(transfer_last5) - float(transfer_avg),
-            "delta10": None if transfer_last10 is None or transfer_avg is None else float(transfer_last10) - float(transfer_avg),
-        },
-        {
-            "label": "Pop Time (s)",
-            "help": METRIC_HELP["pop_time"],
-            "value": _fmt_float(pop_avg),
-            "delta5": None if pop_last5 is None or pop_avg is None else float(pop_last5) - float(pop_avg),
-            "delta10": None if pop_last10 is None or pop_avg is None else float(pop_last10) - float(pop_avg),
-        },
-    ]
+    transfer_avg = transfer_last5 = transfer_last10 = pop_avg = pop_last5 = pop_last10 = None
+    if not practice_timings.empty:
+        n = len(practice_timings)
+        transfer_avg, transfer_last5, transfer_last10 = _prefix_means(practice_timings["transfer_time"], (n, 5, 10))
+        pop_avg, pop_last5, pop_last10 = _prefix_means(practice_timings["pop_time"], (n, 5, 10))
+
+    season_values = [season_metrics["avg"], season_metrics["ops"], transfer_avg, pop_avg]
+    baseline = np.array(season_values, dtype=float)
+    deltas5 = np.array([last5_metrics["avg"], last5_metrics["ops"], transfer_last5, pop_last5], dtype=float) - baseline
+    deltas10 = np.array([last10_metrics["avg"], last10_metrics["ops"], transfer_last10, pop_last10], dtype=float) - baseline
+    cards = zip(
+        ("AVG", "OPS", "Exchange (s)", "Pop Time (s)"),
+        ("avg", "ops", "exchange", "pop_time"),
+        (_fmt_rate, _fmt_rate, _fmt_float, _fmt_float),
+        season_values,
+        [None if np.isnan(delta) else float(delta) for delta in deltas5],
+        [None if np.isnan(delta) else float(delta) for delta in deltas10],
+    )
     row_a = st.columns(2, gap="small")
     row_b = st.columns(2, gap="small")
     all_cols = [row_a[0], row_a[1], row_b[0], row_b[1]]
-    for col, card in zip(all_cols, cards):
+    for col, (label, help_key, fmt, value, delta5, delta10) in zip(all_cols, cards):
         with col:
             st.markdown('<div class="sf-kpi-card">', unsafe_allow_html=True)
             st.metric(
-                label=card["label"],
-                value=card["value"],
-                delta=_fmt_signed(card["delta5"], places=3) if card["delta5"] is not None else "—",
-                help=card["help"],
+                label=label,
+                value=fmt(value),
+                delta=_fmt_signed(delta5, places=3) if delta5 is not None else "—",
+                help=METRIC_HELP[help_key],
             )
             st.caption(
-                f"Season vs Recent: Last 5 {_fmt_signed(card['delta5'], places=3)} | Last 10 {_fmt_signed(card['delta10'], places=3)}"
+                f"Season vs Recent: Last 5 {_fmt_signed(delta5, places=3)} | Last 10 {_fmt_signed(delta10, places=3)}"
             )
-            st.markdown("</div>", unsafe_allow_html=True)
-    st.markdown("</div>", unsafe_allow_html=True)
+            st.markdown(CLOSE_DIV_MD, unsafe_allow_html=True)
+    st.markdown(CLOSE_DIV_MD, unsafe_allow_html=True)
 
 
 def _render_training_suggestions(metric_pack: dict[str, float | None]) -> None:
-    st.markdown('<div class="sf-card">', unsafe_allow_html=True)
+    st.markdown(CARD_OPEN_MD, unsafe_allow_html=True)
     st.markdown('<div class="sf-card-title">Training Suggestions</div>', unsafe_allow_html=True)
     st.markdown(
         '<div class="sf-card-subtitle">Deterministic mapping from stat flags to weekly drill plans.</div>',
@@ -912,11 +1273,11 @@ def _render_training_suggestions(metric_pack: dict[str, float | None]) -> None:
             _render_drill_library_matches(drill, max_items=1)
         if idx < len(suggestions):
             st.markdown("---")
-    st.markdown("</div>", unsafe_allow_html=True)
+    st.markdown(CLOSE_DIV_MD, unsafe_allow_html=True)
 
 
 def _render_dashboard_coach_summary(metric_pack: dict[str, float | None]) -> None:
-    st.markdown('<div class="sf-card sf-standout">', unsafe_allow_html=True)
+    st.markdown(STANDOUT_CARD_OPEN_MD, unsafe_allow_html=True)
     st.markdown('<div class="sf-card-title">Coach Summary</div>', unsafe_allow_html=True)
     st.caption("Current-scope reading using season baseline versus recent sample movement.")
     status_items = [
@@ -933,7 +1294,7 @@ def _render_dashboard_coach_summary(metric_pack: dict[str, float | None]) -> Non
                 unsafe_allow_html=True,
             )
     st.caption("Use these status callouts to prioritize this week’s development plan.")
-    st.markdown("</div>", unsafe_allow_html=True)
+    st.markdown(CLOSE_DIV_MD, unsafe_allow_html=True)
 
 
 def _render_suggested_development_focus(metric_pack: dict[str, float | None], season_metrics: dict[str, float | None]) -> None:
@@ -946,7 +1307,7 @@ def _render_suggested_development_focus(metric_pack: dict[str, float | None], se
         "exchange": metric_pack.get("transfer_avg"),
     }
     suggestions = get_suggestions(stats)
-    st.markdown('<div class="sf-card">', unsafe_allow_html=True)
+    st.markdown(CARD_OPEN_MD, unsafe_allow_html=True)
     st.markdown('<div class="sf-card-title">Suggested Development Focus</div>', unsafe_allow_html=True)
     st.caption("Shared rule engine from statforge_core (baseball-first, deterministic).")
     for idx, item in enumerate(suggestions, start=1):
@@ -954,48 +1315,45 @@ def _render_suggested_development_focus(metric_pack: dict[str, float | None], se
         st.markdown(f"- Why: {item['why']}")
         for drill in item.get("drills", [])[:3]:
             st.markdown(f"- Drill: {drill}")
-    st.markdown("</div>", unsafe_allow_html=True)
+    st.markdown(CLOSE_DIV_MD, unsafe_allow_html=True)
 
 
 def _render_executive_summary(metric_pack: dict[str, float | None]) -> None:
-    good_signals: list[str] = []
-    needs_work: list[str] = []
-
     ops_delta = metric_pack.get("ops_delta_last5_vs_season")
     k_delta = metric_pack.get("k_rate_delta_last5_vs_season")
     pop_delta = metric_pack.get("pop_delta_last5_vs_season")
     cs_pct = metric_pack.get("cs_pct_season")
 
     if ops_delta is not None and ops_delta > 0:
-        good_signals.append(f"OPS is improving ({_fmt_signed(ops_delta, 3)} vs season baseline).")
-    if k_delta is not None and k_delta < 0:
-        good_signals.append(f"K-rate is trending down ({_fmt_signed(k_delta, 3)} vs season baseline).")
-    if pop_delta is not None and pop_delta < 0:
-        good_signals.append(f"Pop time is improving ({_fmt_signed(pop_delta, 3)}s vs season baseline).")
-    if not good_signals:
-        good_signals.append("Performance trend is stable with no major negative movement.")
+        good_signal = f"OPS is improving ({_fmt_signed(ops_delta, 3)} vs season baseline)."
+    elif k_delta is not None and k_delta < 0:
+        good_signal = f"K-rate is trending down ({_fmt_signed(k_delta, 3)} vs season baseline)."
+    elif pop_delta is not None and pop_delta < 0:
+        good_signal = f"Pop time is improving ({_fmt_signed(pop_delta, 3)}s vs season baseline)."
+    else:
+        good_signal = "Performance trend is stable with no major negative movement."
 
     if ops_delta is not None and ops_delta < 0:
-        needs_work.append(f"OPS is below recent baseline ({_fmt_signed(ops_delta, 3)}).")
-    if k_delta is not None and k_delta > 0:
-        needs_work.append(f"K-rate has increased ({_fmt_signed(k_delta, 3)}).")
-    if cs_pct is not None and cs_pct < 0.30:
-        needs_work.append(f"CS% is low for this sample ({_fmt_percent(cs_pct)}).")
-    if not needs_work:
-        needs_work.append("No urgent red flags detected in this filter scope.")
+        needs_work = f"OPS is below recent baseline ({_fmt_signed(ops_delta, 3)})."
+    elif k_delta is not None and k_delta > 0:
+        needs_work = f"K-rate has increased ({_fmt_signed(k_delta, 3)})."
+    elif cs_pct is not None and cs_pct < 0.30:
+        needs_work = f"CS% is low for this sample ({_fmt_percent(cs_pct)})."
+    else:
+        needs_work = "No urgent red flags detected in this filter scope."
 
     next_action = (
         "Run a focused 2x/week catching + plate-discipline block and monitor Last 5 deltas on OPS, K-rate, and Pop time."
     )
 
-    st.markdown('<div class="sf-card sf-standout">', unsafe_allow_html=True)
+    st.markdown(STANDOUT_CARD_OPEN_MD, unsafe_allow_html=True)
     st.markdown('<div class="sf-card-title">Executive Summary</div>', unsafe_allow_html=True)
     st.markdown(
-        f"- **What’s good:** {good_signals[0]}\n"
-        f"- **What needs work:** {needs_work[0]}\n"
+        f"- **What’s good:** {good_signal}\n"
+        f"- **What needs work:** {needs_work}\n"
         f"- **What to do next:** {next_action}"
     )
-    st.markdown("</div>", unsafe_allow_html=True)
+    st.markdown(CLOSE_DIV_MD, unsafe_allow_html=True)
 
 
 def _render_key_metric_help_row(season_metrics: dict[str, float | None], metric_pack: dict[str, float | None]) -> None:
@@ -1008,38 +1366,18 @@ def _render_key_metric_help_row(season_metrics: dict[str, float | None], metric_
     c5.metric("Exchange", _fmt_seconds(metric_pack.get("transfer_avg"), 2), help=METRIC_HELP["exchange"])
 
 
-def _build_recent_trend_insight(perf_df: pd.DataFrame) -> str:
-    if perf_df.empty or len(perf_df) < 3:
-        return "Insight: Not enough recent data to summarize trends."
-
-    lookback = min(5, len(perf_df))
-    recent = perf_df.tail(lookback)
-    if len(recent) < 3:
+def _build_recent_trend_insight(ops: np.ndarray, k_rate: np.ndarray) -> str:
+    if len(ops) < 3:
         return "Insight: Not enough recent data to summarize trends."
 
-    ops_start = float(recent["OPS"].iloc[0])
-    ops_end = float(recent["OPS"].iloc[-1])
-    k_start = float(recent["K Rate"].iloc[0])
-    k_end = float(recent["K Rate"].iloc[-1])
-    ops_delta = ops_end - ops_start
-    k_delta = k_end - k_start
-
-    if ops_delta > 0.01:
-        ops_trend = "up"
-        impact = "suggesting improved offensive efficiency."
-    elif ops_delta < -0.01:
-        ops_trend = "down"
-        impact = "suggesting reduced offensive efficiency."
-    else:
-        ops_trend = "stable"
-        impact = "suggesting steady offensive efficiency."
+    lookback = min(5, len(ops))
+    ops_delta = float(ops[-1] - ops[-lookback])
+    k_delta = float(k_rate[-1] - k_rate[-lookback])
 
-    if abs(k_delta) < 0.01:
-        k_trend = "stable"
-    elif k_delta > 0:
-        k_trend = "up"
-    else:
-        k_trend = "down"
+    ops_sign = 1 if ops_delta > 0.01 else -1 if ops_delta < -0.01 else 0
+    k_sign = 0 if abs(k_delta) < 0.01 else 1 if k_delta > 0 else -1
+    ops_trend, impact = OPS_TREND_WORDING[ops_sign]
+    k_trend = TREND_DIRECTION[k_sign]
 
     return (
         f"Insight: OPS is trending {ops_trend} over the last {lookback} games "
@@ -1047,8 +1385,27 @@ def _build_recent_trend_insight(perf_df: pd.DataFrame) -> str:
     )
 
 
+@st.cache_resource(show_spinner=False)
+def _momentum_chart_template() -> Any:
+    return (
+        alt.Chart()
+        .mark_line(point=True, strokeWidth=3)
+        .encode(
+            x=alt.X("Game:N", sort=None, title="Game"),
+            y=alt.Y("Value:Q", axis=alt.Axis(format=".3f"), title="Metric Value"),
+            color=alt.Color("Metric:N", scale=alt.Scale(range=["#2EA3FF", "#D64545"])),
+            tooltip=[
+                alt.Tooltip("Game:N"),
+                alt.Tooltip("Metric:N"),
+                alt.Tooltip("Value:Q", format=".3f"),
+            ],
+        )
+        .properties(height=250)
+    )
+
+
 def _render_momentum_visual(games_sorted: pd.DataFrame) -> None:
-    st.markdown('<div class="sf-card sf-standout">', unsafe_allow_html=True)
+    st.markdown(STANDOUT_CARD_OPEN_MD, unsafe_allow_html=True)
     st.markdown('<div class="sf-card-title">Recent Performance Trend</div>', unsafe_allow_html=True)
     st.markdown(
         '<div class="sf-card-subtitle">Last 10 games at-a-glance: OPS (higher is better) and K Rate (lower is better).</div>',
@@ -1057,57 +1414,27 @@ def _render_momentum_visual(games_sorted: pd.DataFrame) -> None:
 
     if games_sorted.empty:
         st.info("No games in scope for momentum view.")
-        st.markdown("</div>", unsafe_allow_html=True)
+        st.markdown(CLOSE_DIV_MD, unsafe_allow_html=True)
         return
 
-    sample_games = games_sorted.head(10).copy()
-    sample_games = sample_games.sort_values("game_no")
-    rows: list[dict[str, float | str]] = []
-    for _, row in sample_games.iterrows():
-        game_stats = {
-            "ab": float(row["ab"]),
-            "h": float(row["h"]),
-            "doubles": float(row["doubles"]),
-            "triples": float(row["triples"]),
-            "hr": float(row["hr"]),
-            "bb": float(row["bb"]),
-        }
-        ops = float(compute_hitting_metrics(game_stats)["OPS"])
-        ab = float(row["ab"])
-        bb = float(row["bb"])
-        pa = ab + bb
-        k_rate = (float(row["so"]) / pa) if pa else 0.0
-        rows.append(
-            {
-                "Game": f"G{int(row['game_no'])}",
-                "OPS": ops,
-                "K Rate": k_rate,
-            }
-        )
-    perf_df = pd.DataFrame(rows)
+    sample_games = games_sorted.head(10).sort_values("game_no")
+    ops, k_rate = _per_game_ops_k_rate(sample_games)
+    game_labels = ("G" + sample_games["game_no"].astype("int64").astype(str)).tolist()
 
     if alt is not None:
-        long_df = perf_df.melt(id_vars=["Game"], value_vars=["OPS", "K Rate"], var_name="Metric", value_name="Value")
-        chart = (
-            alt.Chart(long_df)
-            .mark_line(point=True, strokeWidth=3)
-            .encode(
-                x=alt.X("Game:N", sort=None, title="Game"),
-                y=alt.Y("Value:Q", axis=alt.Axis(format=".3f"), title="Metric Value"),
-                color=alt.Color("Metric:N", scale=alt.Scale(range=["#2EA3FF", "#D64545"])),
-                tooltip=[
-                    alt.Tooltip("Game:N"),
-                    alt.Tooltip("Metric:N"),
-                    alt.Tooltip("Value:Q", format=".3f"),
-                ],
-            )
-            .properties(height=250)
+        long_df = pd.DataFrame(
+            {
+                "Game": game_labels * 2,
+                "Metric": np.repeat(["OPS", "K Rate"], len(game_labels)),
+                "Value": np.concatenate([ops, k_rate]),
+            }
         )
-        st.altair_chart(chart, use_container_width=True)
+        st.altair_chart(_momentum_chart_template().properties(data=long_df), use_container_width=True)
     else:
-        st.line_chart(perf_df.set_index("Game")[["OPS", "K Rate"]], use_container_width=True)
-    st.caption(_build_recent_trend_insight(perf_df))
-    st.markdown("</div>", unsafe_allow_html=True)
+        perf_df = pd.DataFrame({"OPS": ops, "K Rate": k_rate}, index=pd.Index(game_labels, name="Game"))
+        st.line_chart(perf_df, use_container_width=True)
+    st.caption(_build_recent_trend_insight(ops, k_rate))
+    st.markdown(CLOSE_DIV_MD, unsafe_allow_html=True)
 
 
 def _render_dashboard(ctx: dict[str, Any], practice_df: pd.DataFrame, summaries_df: pd.DataFrame) -> None:
@@ -1124,7 +1451,8 @@ def _render_dashboard(ctx: dict[str, Any], practice_df: pd.DataFrame, summaries_
             "- **Trends / Pop Time:** Trendline visuals and catcher timing snapshots.\n"
             "- **Export:** Download the current filtered view as CSV."
         )
-    games_sorted = ctx["scoped_games"].sort_values(["season_label", "game_no"], ascending=[False, False])
+    scope_key = _scope_key(ctx)
+    games_sorted = ctx["scoped_games_sorted"]
     if games_sorted.empty:
         _render_empty_state(
             HELP_TEXT["games_empty"],
@@ -1134,16 +1462,18 @@ def _render_dashboard(ctx: dict[str, Any], practice_df: pd.DataFrame, summaries_
         return
 
     with st.spinner("Refreshing dashboard metrics..."):
-        season_metrics = _window_metrics(games_sorted)
-        last5_metrics = _window_metrics(games_sorted.head(5))
-        last10_metrics = _window_metrics(games_sorted.head(10))
-        metric_pack = _build_recommendation_metrics(games_sorted, practice_df)
+        windows = _cached_stat_windows(scope_key, games_sorted)
+        season_metrics = windows["season"]
+        last5_metrics = windows["last5"]
+        last10_metrics = windows["last10"]
+        metric_pack = _cached_recommendation_metrics(scope_key, games_sorted, practice_df)
+        practice_timings = _cached_practice_timings(scope_key, practice_df)
 
     _render_executive_summary(metric_pack)
     _render_dashboard_coach_summary(metric_pack)
     _render_suggested_development_focus(metric_pack, season_metrics)
     _render_key_metric_help_row(season_metrics, metric_pack)
-    _render_kpi_cards(season_metrics, last5_metrics, last10_metrics, practice_df)
+    _render_kpi_cards(season_metrics, last5_metrics, last10_metrics, practice_timings)
     if not st.session_state.get(COACH_MODE_KEY, False):
         st.info(
             "How this helps\n"
@@ -1158,7 +1488,7 @@ def _render_dashboard(ctx: dict[str, Any], practice_df: pd.DataFrame, summaries_
         "Performance Trends (Detailed)", expanded=False
     )
     with trends_container:
-        st.markdown('<div class="sf-card">', unsafe_allow_html=True)
+        st.markdown(CARD_OPEN_MD, unsafe_allow_html=True)
         st.markdown('<div class="sf-card-title">Performance Trends</div>', unsafe_allow_html=True)
         st.markdown(
             '<div class="sf-card-subtitle">Compares current scope against the most recent 5 and 10 games.</div>',
@@ -1171,7 +1501,7 @@ def _render_dashboard(ctx: dict[str, Any], practice_df: pd.DataFrame, summaries_
             l10_val = last10_metrics[key]
             delta5 = None if l5_val is None or season_val is None else (l5_val - season_val)
             delta10 = None if l10_val is None or season_val is None else (l10_val - season_val)
-            inverse = key in {"k_rate", "pb_rate"}
+            inverse = key in INVERSE_METRIC_KEYS
             trend_rows.append(
                 {
                     "Metric": label,
@@ -1186,46 +1516,23 @@ def _render_dashboard(ctx: dict[str, Any], practice_df: pd.DataFrame, summaries_
             )
         st.dataframe(pd.DataFrame(trend_rows), use_container_width=True, hide_index=True)
         st.caption("Based on filtered demo data only.")
-        st.markdown("</div>", unsafe_allow_html=True)
-
-    totals_cols = [
-        "ab",
-        "h",
-        "doubles",
-        "triples",
-        "hr",
-        "bb",
-        "so",
-        "rbi",
-        "sb",
-        "cs",
-        "innings_caught",
-        "passed_balls",
-        "sb_allowed",
-        "cs_caught",
-    ]
-    totals = games_sorted[totals_cols].sum().to_dict() if not games_sorted.empty else {c: 0 for c in totals_cols}
-    st.markdown('<div class="sf-card">', unsafe_allow_html=True)
+        st.markdown(CLOSE_DIV_MD, unsafe_allow_html=True)
+
+    totals = pd.DataFrame([_window_totals(_window_values(games_sorted))])
+    st.markdown(CARD_OPEN_MD, unsafe_allow_html=True)
     st.markdown('<div class="sf-card-title">Season Totals</div>', unsafe_allow_html=True)
     st.markdown(
         '<div class="sf-card-subtitle">Raw volume context for hitting and catching outcomes.</div>',
         unsafe_allow_html=True,
     )
-    st.dataframe(pd.DataFrame([totals]), use_container_width=True, hide_index=True)
-    st.markdown("</div>", unsafe_allow_html=True)
+    st.dataframe(totals, use_container_width=True, hide_index=True)
+    st.markdown(CLOSE_DIV_MD, unsafe_allow_html=True)
 
     transfer_samples = practice_df["transfer_time"].dropna().astype(float).tolist() if not practice_df.empty else []
-    obp_samples: list[float] = []
-    for _, row in games_sorted.iterrows():
-        ab = float(row["ab"])
-        bb = float(row["bb"])
-        h = float(row["h"])
-        denom = ab + bb
-        if denom > 0:
-            obp_samples.append((h + bb) / denom)
-
-    transfer_cons = compute_consistency(transfer_samples) if len(transfer_samples) >= 2 else None
-    obp_cons = compute_consistency(obp_samples) if len(obp_samples) >= 2 else None
+    obp_samples = _per_game_obp_samples(games_sorted)
+
+    transfer_cons = _consistency(transfer_samples)
+    obp_cons = _consistency(obp_samples)
     cons_rows = [
         {
             "Metric": "Transfer Time (s)",
@@ -1242,55 +1549,38 @@ def _render_dashboard(ctx: dict[str, Any], practice_df: pd.DataFrame, summaries_
             "N": len(obp_samples),
         },
     ]
-    st.markdown('<div class="sf-card">', unsafe_allow_html=True)
+    st.markdown(CARD_OPEN_MD, unsafe_allow_html=True)
     st.markdown('<div class="sf-card-title">Consistency Grades</div>', unsafe_allow_html=True)
     st.markdown(
         '<div class="sf-card-subtitle">Sample variation score for repeatability in transfer time and OBP.</div>',
         unsafe_allow_html=True,
     )
     st.dataframe(pd.DataFrame(cons_rows), use_container_width=True, hide_index=True)
-    st.markdown("</div>", unsafe_allow_html=True)
-
-    summary_rows: list[dict[str, Any]] = []
-    for _, row in summaries_df.iterrows():
-        raw = {
-            "ab": row.get("ab", 0),
-            "h": row.get("h", 0),
-            "2b": row.get("doubles", 0),
-            "3b": row.get("triples", 0),
-            "hr": row.get("hr", 0),
-            "bb": row.get("bb", 0),
-            "so": row.get("so", 0),
-            "sb": row.get("sb", 0),
-            "cs": row.get("cs", 0),
-            "sb_allowed": row.get("sb_allowed", 0),
-            "innings_caught": row.get("innings_caught", 0),
-            "pb": row.get("pb", 0),
-            "transfer_time": row.get("transfer_time", 0),
-            "pop_time": row.get("pop_time", 0),
-        }
-        computed = compute_season_summary_metrics(raw)
-        summary_rows.append({"season_label": str(row["season_label"]), **computed})
-    if summary_rows:
-        st.markdown('<div class="sf-card">', unsafe_allow_html=True)
+    st.markdown(CLOSE_DIV_MD, unsafe_allow_html=True)
+
+    summary_table = _season_summary_metrics_frame(summaries_df, include_timing=True)
+    summary_table.insert(0, "season_label", summaries_df["season_label"])
+    if not summary_table.empty:
+        st.markdown(CARD_OPEN_MD, unsafe_allow_html=True)
         st.markdown('<div class="sf-card-title">Season Summary Baseline</div>', unsafe_allow_html=True)
         st.markdown(
             '<div class="sf-card-subtitle">Imported baseline metrics to compare against current in-season performance.</div>',
             unsafe_allow_html=True,
         )
-        st.dataframe(pd.DataFrame(summary_rows), use_container_width=True, hide_index=True)
-        st.markdown("</div>", unsafe_allow_html=True)
+        st.dataframe(summary_table, use_container_width=True, hide_index=True)
+        st.markdown(CLOSE_DIV_MD, unsafe_allow_html=True)
 
 
-def _render_development_plan(ctx: dict[str, Any], practice_df: pd.DataFrame) -> None:
+def _render_development_plan(ctx: dict[str, Any], practice_df: pd.DataFrame, summaries_df: pd.DataFrame) -> None:
     st.subheader("Development Plan")
     st.caption(HELP_TEXT["development_plan"])
 
-    games_sorted = ctx["scoped_games"].sort_values(["season_label", "game_no"], ascending=[False, False])
-    metric_pack = _build_recommendation_metrics(games_sorted, practice_df)
+    scope_key = _scope_key(ctx)
+    games_sorted = ctx["scoped_games_sorted"]
+    metric_pack = _cached_recommendation_metrics(scope_key, games_sorted, practice_df)
     recs = generate_recommendations(metric_pack, max_items=3)
 
-    st.markdown('<div class="sf-card">', unsafe_allow_html=True)
+    st.markdown(CARD_OPEN_MD, unsafe_allow_html=True)
     st.markdown('<div class="sf-card-title">Top 3 Focus Areas</div>', unsafe_allow_html=True)
     st.markdown(
         '<div class="sf-card-subtitle">Deterministic rules engine from the current filtered player profile.</div>',
@@ -1303,7 +1593,7 @@ def _render_development_plan(ctx: dict[str, Any], practice_df: pd.DataFrame) ->
             "Try changing season or player filters to compare a different sample.",
             "empty_development_reset",
         )
-        st.markdown("</div>", unsafe_allow_html=True)
+        st.markdown(CLOSE_DIV_MD, unsafe_allow_html=True)
         return
 
     plan_lines: list[str] = [f"{ctx['player']['player_name']} Development Plan"]
@@ -1333,20 +1623,20 @@ def _render_development_plan(ctx: dict[str, Any], practice_df: pd.DataFrame) ->
                 )
                 plan_lines.append(f"  - {drill.name}: {drill.reps_sets}")
                 _render_drill_library_matches(drill.name, category=rec.category, max_items=1)
-        st.markdown("</div>", unsafe_allow_html=True)
+        st.markdown(CLOSE_DIV_MD, unsafe_allow_html=True)
         coach_summary.append(f"{rec.title}: {rec.why_this_triggered}")
         plan_lines.append("")
 
-    st.markdown("</div>", unsafe_allow_html=True)
+    st.markdown(CLOSE_DIV_MD, unsafe_allow_html=True)
 
-    st.markdown('<div class="sf-card">', unsafe_allow_html=True)
+    st.markdown(CARD_OPEN_MD, unsafe_allow_html=True)
     st.markdown('<div class="sf-card-title">Coach Summary</div>', unsafe_allow_html=True)
     st.markdown(
         f"- Priority focus this cycle: **{recs[0].title}** ({recs[0].priority}).  \n"
         f"- Current K Rate: **{_fmt_rate(metric_pack.get('k_rate_season'))}** | OPS delta (L5 vs season): **{_fmt_signed(metric_pack.get('ops_delta_last5_vs_season'))}**.  \n"
         f"- Catching profile: Exchange **{_fmt_float(metric_pack.get('transfer_avg'))}s**, Pop **{_fmt_float(metric_pack.get('pop_time_avg'))}s**, CS% **{_fmt_rate(metric_pack.get('cs_pct_season'))}**."
     )
-    st.markdown("</div>", unsafe_allow_html=True)
+    st.markdown(CLOSE_DIV_MD, unsafe_allow_html=True)
 
     plan_text = "\n".join(plan_lines).strip()
     if DEMO_MODE:
@@ -1363,11 +1653,11 @@ def _render_development_plan(ctx: dict[str, Any], practice_df: pd.DataFrame) ->
         )
 
 
-def _render_games(ctx: dict[str, Any]) -> None:
+def _render_games(ctx: dict[str, Any], practice_df: pd.DataFrame, summaries_df: pd.DataFrame) -> None:
     st.subheader("Add Game + Stats")
     st.caption("Game log view. Creation, editing, and deletion are available in the desktop app.")
 
-    games_sorted = ctx["scoped_games"].sort_values(["season_label", "game_no"], ascending=[False, False]).copy()
+    games_sorted = ctx["scoped_games_sorted"]
     if games_sorted.empty:
         _render_empty_state(
             HELP_TEXT["games_empty"],
@@ -1375,7 +1665,7 @@ def _render_games(ctx: dict[str, Any]) -> None:
             "empty_games_reset",
         )
         return
-    show = games_sorted.rename(
+    show = games_sorted.reset_index(drop=True).rename(
         columns={
             "season_label": "Season",
             "game_no": "Game #",
@@ -1395,17 +1685,22 @@ def _render_games(ctx: dict[str, Any]) -> None:
             "cs_caught": "CS Caught",
         }
     )
-    st.dataframe(show, use_container_width=True, hide_index=True)
+    st.dataframe(
+        show,
+        use_container_width=True,
+        hide_index=True,
+        column_config={"game_date": st.column_config.DateColumn(format="YYYY-MM-DD")},
+    )
 
-    st.markdown('<div class="sf-card">', unsafe_allow_html=True)
+    st.markdown(CARD_OPEN_MD, unsafe_allow_html=True)
     st.markdown('<div class="sf-card-title">Desktop-only Actions</div>', unsafe_allow_html=True)
     st.markdown(
         "- Save Game + Stat Line  \n- Delete Selected Game  \n- Game Notes editing",
     )
-    st.markdown("</div>", unsafe_allow_html=True)
+    st.markdown(CLOSE_DIV_MD, unsafe_allow_html=True)
 
 
-def _render_practice(practice_df: pd.DataFrame) -> None:
+def _render_practice(ctx: dict[str, Any], practice_df: pd.DataFrame, summaries_df: pd.DataFrame) -> None:
     st.subheader("Practice")
     st.caption("Practice history view for coaching review. Session edits remain desktop-only.")
 
@@ -1416,7 +1711,7 @@ def _render_practice(practice_df: pd.DataFrame) -> None:
             "empty_practice_reset",
         )
     else:
-        practice_sorted = practice_df.sort_values(["season_label", "session_no"], ascending=[False, False]).copy()
+        practice_sorted = practice_df.sort_values(["season_label", "session_no"], ascending=[False, False])
         practice_view = practice_sorted.rename(
             columns={
                 "season_label": "Season",
@@ -1425,7 +1720,12 @@ def _render_practice(practice_df: pd.DataFrame) -> None:
                 "pop_time": "Pop Time",
             }
         )
-        st.dataframe(practice_view, use_container_width=True, hide_index=True)
+        st.dataframe(
+            practice_view,
+            use_container_width=True,
+            hide_index=True,
+            column_config={"session_date": st.column_config.DateColumn(format="YYYY-MM-DD")},
+        )
 
         count = len(practice_sorted)
         transfer_avg = float(practice_sorted["transfer_time"].astype(float).mean())
@@ -1435,15 +1735,15 @@ def _render_practice(practice_df: pd.DataFrame) -> None:
         c2.metric("Avg Transfer", _fmt_seconds(transfer_avg, 2))
         c3.metric("Avg Pop", _fmt_seconds(pop_avg, 2))
 
-    st.markdown('<div class="sf-card">', unsafe_allow_html=True)
+    st.markdown(CARD_OPEN_MD, unsafe_allow_html=True)
     st.markdown('<div class="sf-card-title">Drill Library</div>', unsafe_allow_html=True)
     st.markdown(
         '<div class="sf-card-subtitle">Read-only reference library. Filter by category or keyword.</div>',
         unsafe_allow_html=True,
     )
-    categories = sorted({item["category"] for item in DRILL_LIBRARY})
-    drill_category = st.selectbox("Category", options=["All"] + categories, key="drill_category_filter")
-    drill_query = st.text_input("Search drills", value="", placeholder="e.g., transfer, strikeout, footwork")
+    _seed_tab_widgets({"drill_category_filter": "All", "drill_search": ""})
+    drill_category = st.selectbox("Category", options=["All", *DRILL_CATEGORIES], key="drill_category_filter")
+    drill_query = st.text_input("Search drills", placeholder="e.g., transfer, strikeout, footwork", key="drill_search")
     st.caption("Draft only — resets if page reloads")
     filtered_drills = filter_drill_library(category=drill_category, search_text=drill_query)
 
@@ -1458,7 +1758,7 @@ def _render_practice(practice_df: pd.DataFrame) -> None:
             st.write(f"**Coaching cues:** {drill['coaching_cues']}")
             st.write(f"**Progression:** {drill['progression']}")
             st.write(f"**Equipment:** {drill['equipment']}")
-    st.markdown("</div>", unsafe_allow_html=True)
+    st.markdown(CLOSE_DIV_MD, unsafe_allow_html=True)
 
 
 def _render_trends(ctx: dict[str, Any], practice_df: pd.DataFrame, summaries_df: pd.DataFrame) -> None:
@@ -1473,6 +1773,8 @@ def _render_trends(ctx: dict[str, Any], practice_df: pd.DataFrame, summaries_df:
         )
         return
 
+    season_options = games_sorted["season_label"].unique().tolist()
+    _seed_tab_widgets({"trend_metric": "ops", "trend_inseason_season": season_options[0]})
     metric = st.selectbox(
         "Metric",
         options=["ops", "avg", "obp", "slg", "k_rate", "bb_rate", "cs_pct", "pb_rate", "transfer", "pop"],
@@ -1484,13 +1786,11 @@ def _render_trends(ctx: dict[str, Any], practice_df: pd.DataFrame, summaries_df:
             f"Exchange: {METRIC_HELP['exchange']} | "
             f"Pop time: {METRIC_HELP['pop_time']}"
         ),
+        key="trend_metric",
     )
 
-    season_rows: list[dict[str, Any]] = []
-    for season_label, season_games in games_sorted.groupby("season_label"):
-        m = _window_metrics(season_games)
-        season_rows.append({"season_label": str(season_label), **m})
-    season_df = pd.DataFrame(season_rows).sort_values("season_label")
+    season_totals = games_sorted.groupby("season_label", sort=True)[list(WINDOW_TOTAL_COLUMNS)].sum()
+    season_df = _metrics_frame_from_totals(season_totals).reset_index(names="season_label")
 
     if metric in {"transfer", "pop"}:
         mcol = "transfer_time" if metric == "transfer" else "pop_time"
@@ -1501,7 +1801,7 @@ def _render_trends(ctx: dict[str, Any], practice_df: pd.DataFrame, summaries_df:
             .sort_values("season_label")
         )
     else:
-        line_df = season_df[["season_label", metric]].copy()
+        line_df = season_df[["season_label", metric]]
 
     st.markdown('<div class="sf-card-title">Multi-Season Trendline</div>', unsafe_allow_html=True)
     if line_df.empty:
@@ -1512,43 +1812,24 @@ def _render_trends(ctx: dict[str, Any], practice_df: pd.DataFrame, summaries_df:
     st.markdown('<div class="sf-card-title">In-Season Momentum</div>', unsafe_allow_html=True)
     selected_season = st.selectbox(
         "Season for in-season view",
-        options=sorted(games_sorted["season_label"].astype(str).unique().tolist()),
+        options=season_options,
         key="trend_inseason_season",
     )
-    in_games = games_sorted.loc[games_sorted["season_label"].astype(str) == str(selected_season)].copy()
-    in_games = in_games.sort_values("game_no")
-    cumulative_ops: list[float] = []
-    for idx in range(1, len(in_games) + 1):
-        sub = in_games.iloc[:idx]
-        cumulative_ops.append(float(_window_metrics(sub)["ops"] or 0.0))
+    in_games = games_sorted.loc[games_sorted["season_label"] == selected_season].sort_values("game_no")
     if not in_games.empty:
-        cum_df = pd.DataFrame({"game_no": in_games["game_no"].astype(int).tolist(), "ops": cumulative_ops})
+        running = in_games[["ab", "h", "doubles", "triples", "hr", "bb", "so"]].cumsum()
+        cumulative_ops, _ = _per_game_ops_k_rate(running)
+        cum_df = pd.DataFrame({"game_no": in_games["game_no"].to_numpy(dtype=int), "ops": cumulative_ops})
         st.line_chart(cum_df.set_index("game_no"))
 
     if not summaries_df.empty:
         st.markdown('<div class="sf-card-title">Baseline Overlay</div>', unsafe_allow_html=True)
-        baseline_rows: list[dict[str, Any]] = []
-        for _, row in summaries_df.iterrows():
-            stats = {
-                "ab": row.get("ab", 0),
-                "h": row.get("h", 0),
-                "2b": row.get("doubles", 0),
-                "3b": row.get("triples", 0),
-                "hr": row.get("hr", 0),
-                "bb": row.get("bb", 0),
-                "so": row.get("so", 0),
-                "sb": row.get("sb", 0),
-                "cs": row.get("cs", 0),
-                "sb_allowed": row.get("sb_allowed", 0),
-                "innings_caught": row.get("innings_caught", 0),
-                "pb": row.get("pb", 0),
-            }
-            computed = compute_season_summary_metrics(stats)
-            baseline_rows.append({"Season": row["season_label"], **computed})
-        st.dataframe(pd.DataFrame(baseline_rows), use_container_width=True, hide_index=True)
+        baseline = _season_summary_metrics_frame(summaries_df)
+        baseline.insert(0, "Season", summaries_df["season_label"])
+        st.dataframe(baseline, use_container_width=True, hide_index=True)
 
 
-def _render_pop_time(ctx: dict[str, Any], practice_df: pd.DataFrame) -> None:
+def _render_pop_time(ctx: dict[str, Any], practice_df: pd.DataFrame, summaries_df: pd.DataFrame) -> None:
     st.subheader("Video Analysis")
     st.caption("Position-aware, marker-based timing preview. Full frame-by-frame playback remains in desktop.")
 
@@ -1569,17 +1850,27 @@ def _render_pop_time(ctx: dict[str, Any], practice_df: pd.DataFrame) -> None:
         return
 
     st.caption(f"Markers to set: {', '.join(m.title() for m in protocol.event_markers)}")
-    marker_cols = st.columns(max(len(protocol.event_markers), 1), gap="small")
-    markers: dict[str, float] = {}
-    for idx, marker in enumerate(protocol.event_markers):
-        with marker_cols[idx]:
-            markers[marker] = st.number_input(
-                f"{marker.title()} (s)",
-                min_value=0.0,
-                value=0.0,
-                step=0.01,
-                key=f"video_marker_{analysis_type}_{marker}",
-            )
+    grid_key = f"video_markers_{analysis_type}"
+    drafts = st.session_state.setdefault(TAB_DRAFTS_KEY, {})
+    marker_grid = st.data_editor(
+        pd.DataFrame(
+            {
+                "Marker": [m.title() for m in protocol.event_markers],
+                "Seconds": drafts.get(grid_key, [0.0] * len(protocol.event_markers)),
+            }
+        ),
+        column_config={
+            "Marker": st.column_config.TextColumn("Marker", disabled=True),
+            "Seconds": st.column_config.NumberColumn("Time (s)", min_value=0.0, step=0.01, format="%.2f"),
+        },
+        num_rows="fixed",
+        hide_index=True,
+        use_container_width=True,
+        key=grid_key,
+    )
+    seconds = marker_grid["Seconds"].fillna(0.0).astype(float).tolist()
+    drafts[grid_key] = seconds
+    markers: dict[str, float] = dict(zip(protocol.event_markers, seconds))
 
     if st.button("Compute Metric", key=f"compute_video_metric_{analysis_type}"):
         try:
@@ -1593,9 +1884,10 @@ def _render_pop_time(ctx: dict[str, Any], practice_df: pd.DataFrame) -> None:
                 st.caption(f"Transfer: {_fmt_seconds(float(result.get('transfer_seconds') or 0.0), 2)}")
             if result.get("throw_seconds") is not None:
                 st.caption(f"Throw: {_fmt_seconds(float(result.get('throw_seconds') or 0.0), 2)}")
+            scope_metrics = _window_metrics(ctx["scoped_games"])
             player_stats = {
-                "ops": _window_metrics(ctx["scoped_games"]).get("ops"),
-                "k_rate": _window_metrics(ctx["scoped_games"]).get("k_rate"),
+                "ops": scope_metrics.get("ops"),
+                "k_rate": scope_metrics.get("k_rate"),
                 "pop_time": duration if analysis_type == "Catcher Pop Time" else None,
             }
             suggestions = get_suggestions(player_stats)
@@ -1632,26 +1924,26 @@ def _render_pop_time(ctx: dict[str, Any], practice_df: pd.DataFrame) -> None:
     c2.metric("Throw", _fmt_seconds(float(calc["throw_time"] or 0.0), 2))
     c3.metric("Total Pop", _fmt_seconds(float(calc["pop_total"]), 2))
 
-    st.markdown('<div class="sf-card">', unsafe_allow_html=True)
+    st.markdown(CARD_OPEN_MD, unsafe_allow_html=True)
     st.markdown('<div class="sf-card-title">Rep Set Snapshot</div>', unsafe_allow_html=True)
-    rep_table = practice_sorted.rename(
+    rep_table = practice_sorted[["season_label", "session_no", "transfer_time", "pop_time"]].rename(
         columns={
             "season_label": "Season",
             "session_no": "Rep #",
             "transfer_time": "Transfer",
             "pop_time": "Pop",
         }
-    )[["Season", "Rep #", "Transfer", "Pop"]]
+    )
     st.dataframe(rep_table, use_container_width=True, hide_index=True)
-    st.markdown("</div>", unsafe_allow_html=True)
+    st.markdown(CLOSE_DIV_MD, unsafe_allow_html=True)
 
-    st.markdown('<div class="sf-card">', unsafe_allow_html=True)
+    st.markdown(CARD_OPEN_MD, unsafe_allow_html=True)
     st.markdown('<div class="sf-card-title">Desktop-only Actions</div>', unsafe_allow_html=True)
     st.markdown(
         "- Load video and timeline scrub  \n- Mark protocol events frame-by-frame  \n"
         "- Auto Detect / Auto Build (Catcher Pop Time)  \n- Save to local practice + video analysis"
     )
-    st.markdown("</div>", unsafe_allow_html=True)
+    st.markdown(CLOSE_DIV_MD, unsafe_allow_html=True)
 
 
 def _render_export(ctx: dict[str, Any], practice_df: pd.DataFrame, summaries_df: pd.DataFrame) -> None:
@@ -1663,7 +1955,6 @@ def _render_export(ctx: dict[str, Any], practice_df: pd.DataFrame, summaries_df:
             "Use reset filters to include game and practice rows in export.",
             "empty_export_reset",
         )
-    csv_blob = _build_export_csv(ctx, ctx["scoped_games"], practice_df, summaries_df)
     if DEMO_MODE:
         if st.button("Export current view to CSV", key="export_tab_blocked"):
             safe_export("export")
@@ -1671,7 +1962,7 @@ def _render_export(ctx: dict[str, Any], practice_df: pd.DataFrame, summaries_df:
     else:
         st.download_button(
             label="Export current view to CSV",
-            data=csv_blob,
+            data=_build_export_csv(ctx, ctx["scoped_games"], practice_df, summaries_df),
             file_name="statforge_current_view.csv",
             mime="text/csv",
         )
@@ -1695,60 +1986,56 @@ def _render_export(ctx: dict[str, Any], practice_df: pd.DataFrame, summaries_df:
     )
 
 
-def _render_quick_entry(ctx: dict[str, Any], practice_df: pd.DataFrame) -> None:
+def _render_quick_entry(ctx: dict[str, Any], practice_df: pd.DataFrame, summaries_df: pd.DataFrame) -> None:
     st.subheader("Quick Entry")
     st.caption("Fast, draft-only stat entry for workflow testing. Nothing is persisted in this demo.")
 
+    _seed_tab_widgets({"quick_entry_date": datetime.now().date(), **QUICK_ENTRY_DEFAULTS})
     with st.form("quick_entry_form", clear_on_submit=False):
         c1, c2, c3 = st.columns(3, gap="small")
         with c1:
-            session_date = st.date_input("Date", value=datetime.now().date(), key="quick_entry_date")
+            session_date = st.date_input("Date", key="quick_entry_date")
         with c2:
             session_type = st.selectbox("Session Type", options=["Practice", "Game"], key="quick_entry_type")
         with c3:
-            opponent = st.text_input("Opponent (optional)", value="", key="quick_entry_opp")
+            opponent = st.text_input("Opponent (optional)", key="quick_entry_opp")
 
         st.markdown("**Batting**")
         b1, b2, b3, b4, b5 = st.columns(5, gap="small")
-        ab = b1.number_input("AB", min_value=0, value=0, step=1, key="quick_entry_ab")
-        h = b2.number_input("H", min_value=0, value=0, step=1, key="quick_entry_h")
-        bb = b3.number_input("BB", min_value=0, value=0, step=1, key="quick_entry_bb")
-        so = b4.number_input("SO", min_value=0, value=0, step=1, key="quick_entry_so")
-        rbi = b5.number_input("RBI", min_value=0, value=0, step=1, key="quick_entry_rbi")
+        ab = b1.number_input("AB", min_value=0, step=1, key="quick_entry_ab")
+        h = b2.number_input("H", min_value=0, step=1, key="quick_entry_h")
+        bb = b3.number_input("BB", min_value=0, step=1, key="quick_entry_bb")
+        so = b4.number_input("SO", min_value=0, step=1, key="quick_entry_so")
+        rbi = b5.number_input("RBI", min_value=0, step=1, key="quick_entry_rbi")
 
         st.markdown("**Running**")
         r1, r2 = st.columns(2, gap="small")
-        sb = r1.number_input("SB", min_value=0, value=0, step=1, key="quick_entry_sb")
-        cs = r2.number_input("CS", min_value=0, value=0, step=1, key="quick_entry_cs")
+        sb = r1.number_input("SB", min_value=0, step=1, key="quick_entry_sb")
+        cs = r2.number_input("CS", min_value=0, step=1, key="quick_entry_cs")
 
         st.markdown("**Catching**")
         k1, k2, k3 = st.columns(3, gap="small")
-        innings_caught = k1.number_input("Innings caught", min_value=0.0, value=0.0, step=0.5, key="quick_entry_ic")
-        pb = k2.number_input("PB", min_value=0, value=0, step=1, key="quick_entry_pb")
-        pop_single = k3.number_input("Pop time (single)", min_value=0.0, value=0.0, step=0.01, key="quick_entry_pop")
-        pop_list = st.text_input("Pop time list (optional, comma separated)", value="", key="quick_entry_pop_list")
+        innings_caught = k1.number_input("Innings caught", min_value=0.0, step=0.5, key="quick_entry_ic")
+        pb = k2.number_input("PB", min_value=0, step=1, key="quick_entry_pb")
+        pop_single = k3.number_input("Pop time (single)", min_value=0.0, step=0.01, key="quick_entry_pop")
+        pop_list = st.text_input("Pop time list (optional, comma separated)", key="quick_entry_pop_list")
         st.caption("Draft only — resets if page reloads")
         preview = st.form_submit_button("Preview Summary", use_container_width=True)
 
     if not preview:
         return
 
-    baseline_games = ctx["scoped_games"].sort_values(["season_label", "game_no"], ascending=[False, False])
-    baseline_metrics = _window_metrics(baseline_games)
-    baseline_pack = _build_recommendation_metrics(baseline_games, practice_df)
+    scope_key = _scope_key(ctx)
+    baseline_games = ctx["scoped_games_sorted"]
+    baseline_metrics = _cached_stat_windows(scope_key, baseline_games)["season"]
+    baseline_pack = _cached_recommendation_metrics(scope_key, baseline_games, practice_df)
 
     pop_values: list[float] = []
     if pop_single > 0:
         pop_values.append(float(pop_single))
     if pop_list.strip():
-        for token in pop_list.split(","):
-            token = token.strip()
-            if not token:
-                continue
-            try:
-                pop_values.append(float(token))
-            except ValueError:
-                continue
+        parsed = pd.to_numeric(pd.Series(pop_list.split(","), dtype=str).str.strip(), errors="coerce")
+        pop_values.extend(parsed.dropna().astype(float).tolist())
     pop_avg = sum(pop_values) / len(pop_values) if pop_values else None
 
     totals = {
@@ -1771,7 +2058,7 @@ def _render_quick_entry(ctx: dict[str, Any], practice_df: pd.DataFrame) -> None:
     pa = totals["ab"] + totals["bb"]
     entry_k_rate = (totals["so"] / pa) if pa else None
 
-    st.markdown('<div class="sf-card sf-standout">', unsafe_allow_html=True)
+    st.markdown(STANDOUT_CARD_OPEN_MD, unsafe_allow_html=True)
     st.markdown('<div class="sf-card-title">Today’s Session Summary</div>', unsafe_allow_html=True)
     st.caption(f"{session_type} • {session_date.isoformat()}" + (f" • Opponent: {opponent}" if opponent else ""))
     st.markdown(
@@ -1780,9 +2067,9 @@ def _render_quick_entry(ctx: dict[str, Any], practice_df: pd.DataFrame) -> None:
         f"- Pop time: **{_fmt_seconds(pop_avg, 2)}** (baseline {_fmt_seconds(baseline_pack.get('pop_time_avg'), 2)})\n"
         f"- Exchange proxy: **{_fmt_seconds(float(innings_caught) / max(1.0, float(ab + h + bb + so + 1)), 2)}** (baseline {_fmt_seconds(baseline_pack.get('transfer_avg'), 2)})"
     )
-    st.markdown("</div>", unsafe_allow_html=True)
+    st.markdown(CLOSE_DIV_MD, unsafe_allow_html=True)
 
-    st.markdown('<div class="sf-card">', unsafe_allow_html=True)
+    st.markdown(CARD_OPEN_MD, unsafe_allow_html=True)
     st.markdown('<div class="sf-card-title">Suggested Focus for Next Practice</div>', unsafe_allow_html=True)
     quick_pack = dict(baseline_pack)
     quick_pack["ops_delta_last5_vs_season"] = (
@@ -1822,7 +2109,20 @@ def _render_quick_entry(ctx: dict[str, Any], practice_df: pd.DataFrame) -> None:
         for bullet in bullets[:3]:
             st.markdown(f"- {bullet}")
     st.caption("Draft only — resets if page reloads")
-    st.markdown("</div>", unsafe_allow_html=True)
+    st.markdown(CLOSE_DIV_MD, unsafe_allow_html=True)
+
+
+SectionRenderer = Callable[[dict[str, Any], pd.DataFrame, pd.DataFrame], None]
+SECTION_RENDERERS: dict[str, SectionRenderer] = {
+    "Dashboard": _render_dashboard,
+    "Development Plan ⭐": _render_development_plan,
+    "Games": _render_games,
+    "Practice": _render_practice,
+    "Trends": _render_trends,
+    "Pop Time": _render_pop_time,
+    "Export": _render_export,
+    "Quick Entry": _render_quick_entry,
+}
 
 
 def _render_selected_section(
@@ -1831,22 +2131,9 @@ def _render_selected_section(
     practice_df: pd.DataFrame,
     summaries_df: pd.DataFrame,
 ) -> None:
-    if section == "Dashboard":
-        _render_dashboard(ctx, practice_df, summaries_df)
-    elif section == "Development Plan ⭐":
-        _render_development_plan(ctx, practice_df)
-    elif section == "Games":
-        _render_games(ctx)
-    elif section == "Practice":
-        _render_practice(practice_df)
-    elif section == "Trends":
-        _render_trends(ctx, practice_df, summaries_df)
-    elif section == "Pop Time":
-        _render_pop_time(ctx, practice_df)
-    elif section == "Export":
-        _render_export(ctx, practice_df, summaries_df)
-    elif section == "Quick Entry":
-        _render_quick_entry(ctx, practice_df)
+    renderer = SECTION_RENDERERS.get(section)
+    if renderer is not None:
+        renderer(ctx, practice_df, summaries_df)
 
 
 def main() -> None:
@@ -1864,42 +2151,12 @@ def main() -> None:
         return
     ctx = _build_sidebar(players, games)
 
-    player_id = ctx["player_id"]
-    season = ctx["season"]
-
-    if season == "All":
-        scoped_games = ctx["player_games"].copy()
-        scoped_practice = practice.loc[practice["player_id"] == player_id].copy()
-        scoped_summaries = summaries.loc[summaries["player_id"] == player_id].copy()
-    else:
-        scoped_games = ctx["player_games"].loc[ctx["player_games"]["season_label"].astype(str) == season].copy()
-        scoped_practice = practice.loc[
-            (practice["player_id"] == player_id) & (practice["season_label"].astype(str) == season)
-        ].copy()
-        scoped_summaries = summaries.loc[
-            (summaries["player_id"] == player_id) & (summaries["season_label"].astype(str) == season)
-        ].copy()
-
-    date_range = ctx.get("date_range")
-    if date_range:
-        for col_name in DATE_COLUMNS:
-            if col_name in scoped_games.columns:
-                scoped_games = scoped_games.assign(_parsed_date=pd.to_datetime(scoped_games[col_name], errors="coerce"))
-                scoped_games = scoped_games.loc[
-                    scoped_games["_parsed_date"].between(date_range[0], date_range[1], inclusive="both")
-                ].drop(columns=["_parsed_date"])
-                break
-        for col_name in DATE_COLUMNS:
-            if col_name in scoped_practice.columns:
-                scoped_practice = scoped_practice.assign(
-                    _parsed_date=pd.to_datetime(scoped_practice[col_name], errors="coerce")
-                )
-                scoped_practice = scoped_practice.loc[
-                    scoped_practice["_parsed_date"].between(date_range[0], date_range[1], inclusive="both")
-                ].drop(columns=["_parsed_date"])
-                break
+    scoped_games, scoped_practice, scoped_summaries = _scope_frames(
+        _scope_key(ctx), ctx["player_games"], practice, summaries
+    )
 
     ctx["scoped_games"] = scoped_games
+    ctx["scoped_games_sorted"] = _cached_games_newest_first(_scope_key(ctx), scoped_games)
     _render_sidebar_filters_summary(ctx, scoped_games)
     _render_share_view(ctx)
     _render_sidebar_export(ctx, scoped_games, scoped_practice, scoped_summaries)
@@ -1907,12 +2164,18 @@ def main() -> None:
     _render_top_header(ctx)
     _render_desktop_comparison_panel()
     _render_viewing_context(ctx)
-    _render_header_actions(ctx, scoped_games, scoped_practice)
+    _render_header_actions(ctx, scoped_practice)
 
+    _save_tab_widget_drafts()
     preferred = ctx["section"]
     ordered_sections = [preferred] + [s for s in WEB_SECTIONS if s != preferred]
-    tabs = st.tabs(ordered_sections)
+    if LAZY_TABS:
+        tabs = st.tabs(ordered_sections, key=f"section_tabs_{preferred}", on_change="rerun")
+    else:
+        tabs = st.tabs(ordered_sections)
     for idx, section in enumerate(ordered_sections):
+        if getattr(tabs[idx], "open", None) is False:
+            continue
         with tabs[idx]:
             _render_selected_section(section, ctx, scoped_practice, scoped_summaries)
 
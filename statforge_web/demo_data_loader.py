@@ -92,7 +92,9 @@ def _flatten_games(dataset: dict[str, Any]) -> pd.DataFrame:
 
 
 def _flatten_practice(dataset: dict[str, Any], players_df: pd.DataFrame) -> pd.DataFrame:
-    team_by_player = {int(r["player_id"]): str(r["team"]) for _, r in players_df.iterrows()}
+    team_by_player: dict[int, str] = {}
+    if not players_df.empty:
+        team_by_player = dict(zip(players_df["player_id"].astype(int).tolist(), players_df["team"].astype(str).tolist()))
     rows: list[dict[str, Any]] = []
     for team in dataset.get("teams", []):
         for practice in team.get("practice_sessions", []):
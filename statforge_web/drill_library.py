@@ -108,31 +108,36 @@ def _norm(text: str) -> str:
     return text.strip().lower()
 
 
+_MATCH_CORPUS: list[tuple[DrillItem, str]] = [
+    (row, " ".join([row["name"], row["goal"], row["setup"], row["coaching_cues"]]).lower()) for row in DRILL_LIBRARY
+]
+
+
+DRILL_CATEGORIES: tuple[str, ...] = tuple(sorted({row["category"] for row in DRILL_LIBRARY}))
+_DRILLS_BY_CATEGORY: dict[str, list[DrillItem]] = {
+    category: [row for row in DRILL_LIBRARY if row["category"] == category] for category in DRILL_CATEGORIES
+}
+_FILTER_FIELDS: dict[str, tuple[str, ...]] = {
+    row["id"]: tuple(_norm(row[field]) for field in ("name", "goal", "coaching_cues", "setup", "equipment"))
+    for row in DRILL_LIBRARY
+}
+
+
 def filter_drill_library(category: str = "All", search_text: str = "") -> list[DrillItem]:
     query = _norm(search_text)
-    rows = DRILL_LIBRARY
-    if category != "All":
-        rows = [row for row in rows if row["category"] == category]
+    rows = DRILL_LIBRARY if category == "All" else _DRILLS_BY_CATEGORY.get(category, [])
     if not query:
         return rows
-    return [
-        row
-        for row in rows
-        if query in _norm(row["name"])
-        or query in _norm(row["goal"])
-        or query in _norm(row["coaching_cues"])
-        or query in _norm(row["setup"])
-        or query in _norm(row["equipment"])
-    ]
+    return [row for row in rows if any(query in field for field in _FILTER_FIELDS[row["id"]])]
 
 
 def match_library_drills(text: str, category: str | None = None, limit: int = 3) -> list[DrillItem]:
     words = [w for w in _norm(text).split() if len(w) >= 4]
+    category_key = category.lower() if category else None
     matches: list[tuple[int, DrillItem]] = []
-    for row in DRILL_LIBRARY:
-        if category and row["category"].lower() != category.lower():
+    for row, corpus in _MATCH_CORPUS:
+        if category_key and row["category"].lower() != category_key:
             continue
-        corpus = " ".join([row["name"], row["goal"], row["setup"], row["coaching_cues"]]).lower()
         score = sum(1 for word in words if word in corpus)
         if score > 0:
             matches.append((score, row))
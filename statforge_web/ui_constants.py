@@ -8,6 +8,9 @@ APP_SIGNATURE = "by Anchor & Honor"
 APP_DISCLAIMER = DISCLAIMER
 
 SECTION_GAP_MD = '<div style="margin-top:0.45rem;"></div>'
+CARD_OPEN_MD = '<div class="sf-card">'
+STANDOUT_CARD_OPEN_MD = '<div class="sf-card sf-standout">'
+CLOSE_DIV_MD = "</div>"
 
 HELP_TEXT = {
     "dashboard": "Read-only dashboard built from the current player and season filters.",